@@ -31,6 +31,7 @@ from .constants import (
     BILL_DENOMINATIONS,
     DEFAULT_DEVICE_ADDRESS,
     POLL_INTERVAL_MS,
+    IDLE_POLL_INTERVAL_MS,
     STATES_REQUIRING_ACK,
     get_state_name,
     get_bill_amount,
@@ -71,6 +72,7 @@ __all__ = [
     'BILL_DENOMINATIONS',
     'DEFAULT_DEVICE_ADDRESS',
     'POLL_INTERVAL_MS',
+    'IDLE_POLL_INTERVAL_MS',
     'STATES_REQUIRING_ACK',
     
     # Utility functions
@@ -18,12 +18,15 @@ MIN_PACKET_LENGTH: Final[int] = 6  # Minimum packet length (SYNC+ADR+LNG+CMD+CRC
 
 # Timing constants (page 15)
 POLL_INTERVAL_MS: Final[int] = 200  # Poll every 200ms
+IDLE_POLL_INTERVAL_MS: Final[int] = 500  # Poll interval while the device stays idle
+IDLE_POLLS_BEFORE_BACKOFF: Final[int] = 5  # Idle polls in a row before slowing down
 ACK_TIMEOUT_MS: Final[int] = 10  # ACK must be sent within 10ms
 RESPONSE_TIMEOUT_S: Final[float] = 1.0  # Response timeout in seconds
 
 # Buffer constants
 FLUSH_BUFFER_SIZE: Final[int] = 100  # Bytes to read when flushing buffer
 FLUSH_TIMEOUT_S: Final[float] = 0.1  # Timeout for buffer flush
+DRAIN_THRESHOLD_BYTES: Final[int] = 256  # Undrained writes are drained past this backlog
 
 
 class Command(IntEnum):
@@ -155,6 +158,12 @@ STATES_REQUIRING_ACK: set[int] = {
     DeviceState.CHEATED,           # 0x45 - Cheating attempt detected
 }
 
+# States in which nothing is going on; polling slows down while they last
+IDLE_STATES: frozenset[int] = frozenset({
+    DeviceState.IDLING,            # 0x14 - Waiting for a bill
+    DeviceState.UNIT_DISABLED,     # 0x19 - Bill acceptance disabled
+})
+
 
 def get_state_name(state_code: int | None) -> str:
     """Get human-readable state name from state code."""
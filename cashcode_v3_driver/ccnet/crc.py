@@ -5,14 +5,245 @@ Implementation based on CCNET Protocol Description page 10.
 Uses polynomial 0x08408 (reversed CCITT polynomial).
 """
 
+import functools
+import os
+import struct
+
+try:
+    from binascii import crc_hqx
+except ImportError:  # Minimal builds (e.g. MicroPython) lack crc_hqx
+    crc_hqx = None
+
 from .constants import CRC_POLYNOMIAL
 
 
-def calculate_crc16(data: bytes) -> bytes:
+# Any object supporting the buffer protocol with byte items
+BytesLike = bytes | bytearray | memoryview
+
+
+def _crc16_step(value: int, bits: int) -> int:
+    """
+    Shift a value through the reflected CRC16 register bit by bit.
+    
+    This is the bit-serial CRC update. Evaluating it for every possible
+    input chunk once turns the per-byte loop into a table lookup.
+    
+    Args:
+        value: Register contents XORed with the input chunk.
+        bits: Number of bits to shift.
+        
+    Returns:
+        Register contents after ``bits`` shifts.
+    """
+    for _ in range(bits):
+        # Branchless: mask is the polynomial when the low bit is set
+        value = (value >> 1) ^ (CRC_POLYNOMIAL & -(value & 0x0001))
+    return value
+
+
+def _build_crc16_table() -> tuple[int, ...]:
+    """
+    Build the 256-entry byte-wise CRC16 lookup table (Sarwate algorithm).
+    
+    Entry ``n`` is the CRC register after shifting byte ``n`` through
+    the reflected polynomial eight times, so a whole byte can be
+    processed with a single table lookup.
+    
+    Returns:
+        Tuple of 256 precomputed 16-bit values.
+    """
+    return tuple(_crc16_step(byte, 8) for byte in range(256))
+
+
+def _build_crc16_nibble_table() -> tuple[int, ...]:
+    """
+    Build the 16-entry nibble-wise CRC16 lookup table.
+    
+    Entry ``n`` is the CRC register after shifting nibble ``n`` through
+    the reflected polynomial four times. Two lookups process a byte.
+    
+    Returns:
+        Tuple of 16 precomputed 16-bit values.
+    """
+    return tuple(_crc16_step(nibble, 4) for nibble in range(16))
+
+
+def _build_crc16_slice_tables(
+    table: tuple[int, ...],
+    count: int = 8,
+) -> tuple[tuple[int, ...], ...]:
+    """
+    Build slice-by-N tables from the byte-wise CRC16 table.
+    
+    Table ``k`` holds the CRC register after byte ``n`` followed by
+    ``k`` zero bytes, which lets ``count`` bytes be folded into the
+    register with ``count`` independent lookups.
+    
+    Args:
+        table: Byte-wise (slice-by-1) lookup table.
+        count: Number of bytes processed per step.
+        
+    Returns:
+        Tuple of ``count`` lookup tables.
+    """
+    tables = [table]
+    
+    for _ in range(count - 1):
+        previous = tables[-1]
+        tables.append(tuple(
+            (crc >> 8) ^ table[crc & 0xFF] for crc in previous
+        ))
+    
+    return tuple(tables)
+
+
+# Precomputed once at import time
+_CRC16_TABLE: tuple[int, ...] = _build_crc16_table()
+_CRC16_SLICE_TABLES: tuple[tuple[int, ...], ...] = _build_crc16_slice_tables(_CRC16_TABLE)
+_CRC16_NIBBLE_TABLE: tuple[int, ...] = _build_crc16_nibble_table()
+
+# Pre-bound packer/unpacker for the little-endian 2-byte CRC field
+_CRC_PACK = struct.Struct('<H').pack
+_CRC_UNPACK = struct.Struct('<H').unpack_from
+
+# Bit-reversed value of every byte
+_BIT_REVERSE: bytes = bytes(int(f'{n:08b}'[::-1], 2) for n in range(256))
+
+
+def _crc16_table(data: BytesLike) -> int:
+    """
+    Calculate CRC16 of data as an integer in pure Python.
+    
+    Portable fallback for interpreters without binascii.crc_hqx.
+    
+    Args:
+        data: Bytes to calculate CRC for.
+        
+    Returns:
+        16-bit CRC value.
+    """
+    crc: int = 0
+    t0, t1, t2, t3, t4, t5, t6, t7 = _CRC16_SLICE_TABLES
+    
+    # Fold 8 bytes per step: the register is XORed into the low
+    # bytes of the word, then every byte is advanced independently
+    tail = len(data) - len(data) % 8
+    for i in range(0, tail, 8):
+        word = int.from_bytes(data[i:i + 8], 'little') ^ crc
+        crc = (
+            t7[word & 0xFF]
+            ^ t6[(word >> 8) & 0xFF]
+            ^ t5[(word >> 16) & 0xFF]
+            ^ t4[(word >> 24) & 0xFF]
+            ^ t3[(word >> 32) & 0xFF]
+            ^ t2[(word >> 40) & 0xFF]
+            ^ t1[(word >> 48) & 0xFF]
+            ^ t0[word >> 56]
+        )
+    
+    # Remaining bytes one at a time
+    for byte in data[tail:]:
+        crc = (crc >> 8) ^ t0[(crc ^ byte) & 0xFF]
+    
+    return crc
+
+
+def _crc16_nibble(data: BytesLike) -> int:
+    """
+    Calculate CRC16 of data as an integer with a 16-entry table.
+    
+    Slower than the full tables but keeps the working set of the
+    loop at 16 entries, which suits small-cache embedded cores.
+    
+    Args:
+        data: Bytes to calculate CRC for.
+        
+    Returns:
+        16-bit CRC value.
+    """
+    crc: int = 0
+    table = _CRC16_NIBBLE_TABLE
+    
+    for byte in data:
+        crc ^= byte
+        crc = (crc >> 4) ^ table[crc & 0x0F]
+        crc = (crc >> 4) ^ table[crc & 0x0F]
+    
+    return crc
+
+
+def _crc16_native(data: BytesLike) -> int:
+    """
+    Calculate CRC16 of data as an integer using binascii.crc_hqx.
+    
+    crc_hqx implements the non-reflected CRC-CCITT (0x1021) in C.
+    The reflected CCNET CRC (0x8408) of a message equals the
+    bit-reversed crc_hqx of the message with every byte bit-reversed,
+    so the whole loop runs in C.
+    
+    The bit-reversed message is the only copy made for bytes and
+    bytearray input. memoryview has no translate(), so a view is
+    copied to bytes first.
+    
+    Args:
+        data: Bytes to calculate CRC for.
+        
+    Returns:
+        16-bit CRC value.
+    """
+    if type(data) is memoryview:
+        data = data.tobytes()
+    crc = crc_hqx(data.translate(_BIT_REVERSE), 0)
+    return (_BIT_REVERSE[crc & 0xFF] << 8) | _BIT_REVERSE[crc >> 8]
+
+
+# Available CRC kernels by name
+_CRC16_KERNELS = {
+    'table': _crc16_table,
+    'nibble': _crc16_nibble,
+}
+if crc_hqx is not None:
+    _CRC16_KERNELS['native'] = _crc16_native
+
+# Integer CRC kernel shared by the public helpers.
+# Set CCNET_CRC_VARIANT to 'native', 'table' or 'nibble' to override.
+_crc16_kernel = _CRC16_KERNELS.get(
+    os.environ.get('CCNET_CRC_VARIANT', ''),
+    _CRC16_KERNELS.get('native', _crc16_table),
+)
+
+# Control frames (POLL, ACK, NAK, ...) and idle poll replies repeat
+# constantly, so their CRCs are cached. Keys must be immutable bytes.
+_crc16_int = functools.lru_cache(maxsize=64)(_crc16_kernel)
+
+
+def _crc16_buffer(data: BytesLike) -> int:
+    """
+    Calculate CRC16 of any bytes-like object as an integer.
+    
+    bytes go through the cache and bytearray is passed to the kernel
+    as is. Other buffers (e.g. a memoryview over a receive buffer) are
+    passed as a byte view; only the native kernel copies those.
+    
+    Args:
+        data: Bytes-like object to calculate CRC for.
+        
+    Returns:
+        16-bit CRC value.
+    """
+    if type(data) is bytes:
+        return _crc16_int(data)
+    if type(data) is bytearray:
+        return _crc16_kernel(data)
+    return _crc16_kernel(memoryview(data).cast('B'))
+
+
+def calculate_crc16(data: BytesLike) -> bytes:
     """
     Calculate CRC16 checksum for CCNET packet.
     
-    Uses CCITT algorithm with polynomial 0x08408 (bit-reversed 0x1021).
+    Uses CCITT algorithm with polynomial 0x08408 (bit-reversed 0x1021),
+    computed in C via binascii where available.
     The CRC is returned as 2 bytes in little-endian format.
     
     Args:
@@ -27,26 +258,16 @@ def calculate_crc16(data: bytes) -> bytes:
         >>> len(crc)
         2
     """
-    crc: int = 0
-    
-    for byte in data:
-        crc ^= byte
-        for _ in range(8):
-            if crc & 0x0001:
-                crc = (crc >> 1) ^ CRC_POLYNOMIAL
-            else:
-                crc = crc >> 1
-    
-    return crc.to_bytes(2, byteorder='little')
+    return _CRC_PACK(_crc16_buffer(data))
 
 
-def verify_crc16(data: bytes) -> bool:
+def verify_crc16(data: BytesLike) -> bool:
     """
     Verify CRC16 checksum of a complete CCNET packet.
     
     The packet must include the CRC bytes at the end.
-    When CRC is calculated over the entire packet (including CRC bytes),
-    the result should be 0 for a valid packet.
+    The CRC is calculated over the packet without its last 2 bytes
+    and compared with the received little-endian CRC.
     
     Args:
         data: Complete packet including CRC bytes.
@@ -62,22 +283,11 @@ def verify_crc16(data: bytes) -> bool:
     if len(data) < 5:  # Minimum packet: SYNC + ADR + LNG + CMD + CRC(2)
         return False
     
-    # Calculate CRC over entire packet including received CRC
-    # Result should be 0 for valid packet
-    crc: int = 0
-    
-    for byte in data:
-        crc ^= byte
-        for _ in range(8):
-            if crc & 0x0001:
-                crc = (crc >> 1) ^ CRC_POLYNOMIAL
-            else:
-                crc = crc >> 1
-    
-    return crc == 0
+    expected, = _CRC_UNPACK(data, len(data) - 2)
+    return _crc16_buffer(data[:-2]) == expected
 
 
-def append_crc(data: bytes) -> bytes:
+def append_crc(data: BytesLike) -> bytes:
     """
     Append CRC16 checksum to data.
     
@@ -87,4 +297,5 @@ def append_crc(data: bytes) -> bytes:
     Returns:
         Packet data with CRC appended.
     """
-    return data + calculate_crc16(data)
+    packet = bytes(data)
+    return packet + _CRC_PACK(_crc16_int(packet))
@@ -38,6 +38,9 @@ from .constants import (
     EventType,
     DEFAULT_DEVICE_ADDRESS,
     POLL_INTERVAL_MS,
+    IDLE_POLL_INTERVAL_MS,
+    IDLE_POLLS_BEFORE_BACKOFF,
+    IDLE_STATES,
     get_state_name,
     get_bill_amount,
 )
@@ -69,12 +72,31 @@ class CashCodeDriver:
         address: Device address (default 0x03 for Bill Validator).
     """
     
+    __slots__ = (
+        '_port',
+        '_baudrate',
+        '_address',
+        '_auto_stack',
+        '_poll_interval_ms',
+        '_idle_poll_interval_ms',
+        '_transport',
+        '_protocol',
+        '_state_machine',
+        '_connected',
+        '_accepting_enabled',
+        '_poll_task',
+        '_stop_event',
+        '_callbacks',
+    )
+    
     def __init__(
         self,
         port: str,
         baudrate: int = 9600,
         address: int = DEFAULT_DEVICE_ADDRESS,
         auto_stack: bool = True,
+        poll_interval_ms: int = POLL_INTERVAL_MS,
+        idle_poll_interval_ms: int = IDLE_POLL_INTERVAL_MS,
     ) -> None:
         """
         Initialize the driver.
@@ -84,11 +106,17 @@ class CashCodeDriver:
             baudrate: Serial port baudrate (default 9600).
             address: CCNET device address (default 0x03).
             auto_stack: Automatically stack bills in escrow (default True).
+            poll_interval_ms: Poll interval while the device is active
+                (default 200 ms).
+            idle_poll_interval_ms: Poll interval once the device has been
+                idle for several polls in a row (default 500 ms).
         """
         self._port = port
         self._baudrate = baudrate
         self._address = address
         self._auto_stack = auto_stack
+        self._poll_interval_ms = poll_interval_ms
+        self._idle_poll_interval_ms = idle_poll_interval_ms
         
         # Components (initialized on connect)
         self._transport: Optional[CCNETTransport] = None
@@ -102,7 +130,7 @@ class CashCodeDriver:
         self._stop_event = asyncio.Event()
         
         # Callbacks
-        self._callbacks: dict[str, list[EventCallback]] = {}
+        self._callbacks: dict[str, tuple[EventCallback, ...]] = {}
     
     @property
     def port(self) -> str:
@@ -164,9 +192,8 @@ class CashCodeDriver:
             event_type: Event type string.
             callback: Async callback function(event_type, context).
         """
-        if event_type not in self._callbacks:
-            self._callbacks[event_type] = []
-        self._callbacks[event_type].append(callback)
+        # Tuples are rebuilt on change, so emitting iterates a snapshot
+        self._callbacks[event_type] = self._callbacks.get(event_type, ()) + (callback,)
         
         # Also register with state machine for state-related events
         self._state_machine.add_callback(event_type, callback)
@@ -183,11 +210,10 @@ class CashCodeDriver:
             event_type: Event type.
             callback: Callback to remove.
         """
-        if event_type in self._callbacks:
-            try:
-                self._callbacks[event_type].remove(callback)
-            except ValueError:
-                pass
+        callbacks = self._callbacks.get(event_type, ())
+        if callback in callbacks:
+            index = callbacks.index(callback)
+            self._callbacks[event_type] = callbacks[:index] + callbacks[index + 1:]
         
         self._state_machine.remove_callback(event_type, callback)
     
@@ -199,22 +225,29 @@ class CashCodeDriver:
         """
         Emit an event to all registered callbacks.
         
+        Callbacks run concurrently; errors are logged per callback.
+        
         Args:
             event_type: Event type.
             context: Optional state context.
         """
+        callbacks = self._callbacks.get(event_type)
+        if not callbacks:
+            return
+        
         if context is None:
             context = StateContext(
                 previous_state=None,
                 current_state=self._state_machine.current_state or 0,
             )
         
-        callbacks = self._callbacks.get(event_type, [])
-        for callback in callbacks:
-            try:
-                await callback(event_type, context)
-            except Exception as e:
-                logger.error(f"Callback error for {event_type}: {e}")
+        results = await asyncio.gather(
+            *(callback(event_type, context) for callback in callbacks),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Callback error for %s: %s", event_type, result)
     
     async def connect(self) -> bool:
         """
@@ -263,7 +296,7 @@ class CashCodeDriver:
             for _ in range(max_init_polls):
                 response = await self._protocol.poll()
                 if response:
-                    logger.debug(f"Init poll: {response.state_name} (0x{response.state:02X})")
+                    logger.debug("Init poll: %s (0x%02X)", response.state_name, response.state)
                     
                     # Device is ready when in IDLING or UNIT_DISABLED state
                     if response.state in (DeviceState.IDLING, DeviceState.UNIT_DISABLED):
@@ -310,7 +343,7 @@ class CashCodeDriver:
             try:
                 await self._protocol.close()
             except Exception as e:
-                logger.debug(f"Close error: {e}")
+                logger.debug("Close error: %s", e)
         
         self._transport = None
         self._protocol = None
@@ -457,6 +490,8 @@ class CashCodeDriver:
         self._stop_event.set()
         self._accepting_enabled = False
         
+        # Wait for the poll loop to exit, it holds a reference to the
+        # protocol that _cleanup() is about to release
         if self._poll_task:
             self._poll_task.cancel()
             try:
@@ -502,30 +537,105 @@ class CashCodeDriver:
         Main polling loop.
         
         Continuously polls the device and processes responses.
-        """
+        
+        Each response is handled in a background task that overlaps
+        with the wait for the next poll. The task is awaited before the
+        next POLL is sent, since handling may itself talk to the device
+        (STACK, re-enable) and CCNET is strictly request/response.
+        Cancelling the loop never cancels a handler; it is finished
+        before the loop exits.
+        Steady-state responses (same state, no data) have nothing to
+        handle and get no task.
+        
+        After IDLE_POLLS_BEFORE_BACKOFF idle responses in a row the
+        loop switches to the idle poll interval; any other state
+        switches back to the active interval at once.
+        """
+        # Bind hot-path lookups once. The protocol is never swapped while
+        # the loop runs (_re_enable_bill_types reuses the same instance),
+        # and stop() waits for this task before _cleanup() clears it.
+        protocol = self._protocol
+        if protocol is None:
+            logger.error("Not connected")
+            return
+        
         logger.info("Poll loop started")
-        poll_interval = POLL_INTERVAL_MS / 1000.0
+        active_interval = self._poll_interval_ms / 1000.0
+        idle_interval = self._idle_poll_interval_ms / 1000.0
+        idle_polls = 0
+        handler_task: Optional[asyncio.Task] = None
+        loop = asyncio.get_running_loop()
+        next_deadline = loop.time()
+        
+        poll = protocol.poll
+        handle = self._handle_poll_response
+        state_machine = self._state_machine
+        create_task = asyncio.create_task
+        shield = asyncio.shield
+        sleep = asyncio.sleep
+        clock = loop.time
+        stop_is_set = self._stop_event.is_set
         
         try:
-            while not self._stop_event.is_set():
+            while not stop_is_set():
                 try:
+                    # Finish handling the previous response. Shielded, so
+                    # cancelling the loop here leaves the handler running
+                    # and still referenced for the finally block below
+                    if handler_task:
+                        task = handler_task
+                        try:
+                            await shield(task)
+                        finally:
+                            if task.done():
+                                handler_task = None
+                    
                     # Poll device
-                    response = await self._protocol.poll()
+                    response = await poll()
                     
                     if response:
-                        await self._handle_poll_response(response)
+                        # Steady state (e.g. IDLING on every poll): an
+                        # unchanged state without data cannot emit events,
+                        # auto-stack or re-enable. The previous handler is
+                        # done, so current_state is up to date.
+                        if response.data or response.state != state_machine.current_state:
+                            handler_task = create_task(handle(response))
+                        if response.state in IDLE_STATES:
+                            idle_polls += 1
+                        else:
+                            idle_polls = 0
                     
-                    # Wait for next poll
-                    await asyncio.sleep(poll_interval)
+                    poll_interval = (
+                        idle_interval
+                        if idle_polls >= IDLE_POLLS_BEFORE_BACKOFF
+                        else active_interval
+                    )
                     
+                    # Wait for next poll on a fixed cadence, so the time
+                    # spent polling does not stretch the interval
+                    next_deadline += poll_interval
+                    delay = next_deadline - clock()
+                    if delay < 0:
+                        # Missed the tick: realign instead of catching up
+                        logger.debug("Poll tick missed by %.0f ms", -delay * 1000)
+                        next_deadline = clock()
+                        delay = 0.0
+                    await sleep(delay)
+                
                 except asyncio.CancelledError:
                     logger.debug("Poll loop cancelled")
                     break
                 except Exception as e:
                     logger.error(f"Poll error: {e}")
                     await asyncio.sleep(1.0)  # Back off on error
-                    
+        
         finally:
+            # Don't drop an already received event (e.g. BILL_STACKED)
+            if handler_task:
+                try:
+                    await handler_task
+                except Exception as e:
+                    logger.error(f"Poll error: {e}")
             logger.info("Poll loop stopped")
     
     async def _handle_poll_response(self, response: PollResponse) -> None:
@@ -534,6 +644,8 @@ class CashCodeDriver:
         
         Updates state machine, handles escrow auto-stacking, and
         automatically re-enables bill types when device goes to UNIT_DISABLED.
+        Only called for responses that carry data or a new state;
+        _poll_loop filters out the rest.
         
         Args:
             response: Poll response from device.
@@ -10,8 +10,7 @@ providing protocol-specific functionality.
 
 import asyncio
 import logging
-from dataclasses import dataclass
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from .constants import (
     Command,
@@ -27,11 +26,18 @@ from .transport import CCNETTransport, CCNETPacket
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class PollResponse:
+# Plain ints for the per-poll ACK/NAK checks (no IntEnum on the hot path)
+_ACK_INT = int(Command.ACK)
+_NAK_INT = int(Command.NAK)
+
+
+class PollResponse(NamedTuple):
     """
     Parsed response to POLL command.
     
+    A NamedTuple: immutable, no per-instance __dict__, and fields are
+    read by index at C level.
+    
     Attributes:
         state: Device state code.
         data: Additional data bytes (e.g., bill code).
@@ -51,9 +57,8 @@ class PollResponse:
     @property
     def bill_code(self) -> Optional[int]:
         """Get bill code from data (if present)."""
-        if len(self.data) > 0:
-            return self.data[0]
-        return None
+        data = self.data
+        return data[0] if data else None
 
 
 class CCNETProtocol:
@@ -66,6 +71,10 @@ class CCNETProtocol:
         transport: Underlying transport layer.
     """
     
+    __slots__ = (
+        '_transport',
+    )
+    
     def __init__(self, transport: CCNETTransport) -> None:
         """
         Initialize protocol layer.
@@ -80,9 +89,14 @@ class CCNETProtocol:
         """Get transport layer."""
         return self._transport
     
-    async def send_ack(self) -> None:
-        """Send ACK (acknowledgement) to device."""
-        await self._transport.send_command(Command.ACK)
+    async def send_ack(self, drain: bool = True) -> None:
+        """
+        Send ACK (acknowledgement) to device.
+        
+        Args:
+            drain: Wait for the write buffer to flush (see CCNETTransport.send_raw).
+        """
+        await self._transport.send_command(Command.ACK, drain=drain)
     
     async def send_nak(self) -> None:
         """Send NAK (negative acknowledgement) to device."""
@@ -120,7 +134,8 @@ class CCNETProtocol:
         Returns:
             Parsed poll response or None on error.
         """
-        await self._transport.send_command(Command.POLL)
+        # Not drained: receiving the answer proves the frame went out
+        await self._transport.send_command(Command.POLL, drain=False)
         
         response = await self._transport.receive_packet()
         if not response:
@@ -131,19 +146,21 @@ class CCNETProtocol:
         data = response.data
         
         # Send ACK for event states that require acknowledgment
-        # Per CCNET protocol, these states will repeat until ACK is sent
+        # Per CCNET protocol, these states will repeat until ACK is sent.
+        # The ACK is written right away (10 ms window) but not drained:
+        # like POLL it is drained only if the write backlog builds up.
         if state in STATES_REQUIRING_ACK:
-            logger.debug(f"Sending ACK for event state: {get_state_name(state)}")
+            logger.debug("Sending ACK for event state: %s", get_state_name(state))
             try:
-                await self.send_ack()
+                await self.send_ack(drain=False)
             except Exception as e:
                 logger.warning(f"Failed to send ACK for {get_state_name(state)}: {e}")
         
         return PollResponse(
             state=state,
             data=data,
-            is_ack=(state == Command.ACK),
-            is_nak=(state == Command.NAK),
+            is_ack=(state == _ACK_INT),
+            is_nak=(state == _NAK_INT),
         )
     
     async def set_security(
@@ -162,12 +179,8 @@ class CCNETProtocol:
         Returns:
             True if command acknowledged.
         """
-        # Build data: 3 bytes security mask (Y1-Y3)
-        data = bytes([
-            (security_mask >> 0) & 0xFF,   # Y1
-            (security_mask >> 8) & 0xFF,   # Y2
-            (security_mask >> 16) & 0xFF,  # Y3
-        ])
+        # Build data: 3 bytes security mask (Y1-Y3), Y1 is the low byte
+        data = (security_mask & 0xFFFFFF).to_bytes(3, 'little')
         
         logger.info(f"Setting security: mask=0x{security_mask:06X}")
         await self._transport.send_command(Command.SET_SECURITY, data)
@@ -201,14 +214,10 @@ class CCNETProtocol:
             True if command acknowledged.
         """
         # Build data: 3 bytes bill enable mask (Y1-Y3) + 3 bytes escrow enable mask (Y4-Y6)
-        data = bytes([
-            (bill_enable_mask >> 0) & 0xFF,    # Y1
-            (bill_enable_mask >> 8) & 0xFF,    # Y2
-            (bill_enable_mask >> 16) & 0xFF,   # Y3
-            (escrow_enable_mask >> 0) & 0xFF,  # Y4
-            (escrow_enable_mask >> 8) & 0xFF,  # Y5
-            (escrow_enable_mask >> 16) & 0xFF, # Y6
-        ])
+        data = (
+            (bill_enable_mask & 0xFFFFFF).to_bytes(3, 'little')
+            + (escrow_enable_mask & 0xFFFFFF).to_bytes(3, 'little')
+        )
         
         logger.info(f"Enabling bill types: bill_mask=0x{bill_enable_mask:06X}, escrow_mask=0x{escrow_enable_mask:06X}")
         await self._transport.send_command(Command.ENABLE_BILL_TYPES, data)
@@ -40,7 +40,7 @@ class ValidatorPhase(Enum):
     DISABLED = auto()      # Unit disabled
 
 
-@dataclass
+@dataclass(slots=True)
 class StateContext:
     """
     Context information for a state transition.
@@ -105,7 +105,7 @@ class BillValidatorStateMachine:
         self._current_state: Optional[int] = None
         self._previous_state: Optional[int] = None
         self._state_history: list[int] = []
-        self._callbacks: dict[str, list[EventCallback]] = {}
+        self._callbacks: dict[str, tuple[EventCallback, ...]] = {}
         self._pending_bill_code: Optional[int] = None
         self._escrow_processed: bool = False
     
@@ -172,9 +172,8 @@ class BillValidatorStateMachine:
             event_type: Event type (from EventType).
             callback: Async callback function.
         """
-        if event_type not in self._callbacks:
-            self._callbacks[event_type] = []
-        self._callbacks[event_type].append(callback)
+        # Tuples are rebuilt on change, so emitting iterates a snapshot
+        self._callbacks[event_type] = self._callbacks.get(event_type, ()) + (callback,)
     
     def remove_callback(
         self,
@@ -188,11 +187,10 @@ class BillValidatorStateMachine:
             event_type: Event type.
             callback: Callback to remove.
         """
-        if event_type in self._callbacks:
-            try:
-                self._callbacks[event_type].remove(callback)
-            except ValueError:
-                pass
+        callbacks = self._callbacks.get(event_type, ())
+        if callback in callbacks:
+            index = callbacks.index(callback)
+            self._callbacks[event_type] = callbacks[:index] + callbacks[index + 1:]
     
     async def _emit_event(
         self,
@@ -202,16 +200,23 @@ class BillValidatorStateMachine:
         """
         Emit an event to all registered callbacks.
         
+        Callbacks run concurrently; errors are logged per callback.
+        
         Args:
             event_type: Event type.
             context: State context.
         """
-        callbacks = self._callbacks.get(event_type, [])
-        for callback in callbacks:
-            try:
-                await callback(event_type, context)
-            except Exception as e:
-                logger.error(f"Callback error for {event_type}: {e}")
+        callbacks = self._callbacks.get(event_type)
+        if not callbacks:
+            return
+        
+        results = await asyncio.gather(
+            *(callback(event_type, context) for callback in callbacks),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Callback error for %s: %s", event_type, result)
     
     async def process_state(
         self,
@@ -236,11 +241,10 @@ class BillValidatorStateMachine:
         if len(self._state_history) > self.HISTORY_SIZE:
             self._state_history.pop(0)
         
-        # Log state change
-        state_name = get_state_name(state_code)
-        if self._previous_state != state_code:
+        # Log state change (names are only resolved when DEBUG is on)
+        if self._previous_state != state_code and logger.isEnabledFor(logging.DEBUG):
             prev_name = get_state_name(self._previous_state) if self._previous_state else "None"
-            logger.debug(f"State transition: {prev_name} -> {state_name}")
+            logger.debug("State transition: %s -> %s", prev_name, get_state_name(state_code))
         
         # Build context
         bill_code = data[0] if data and len(data) > 0 else None
@@ -0,0 +1,11 @@
+"""
+Pytest configuration for CCNET tests.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the driver directory to the path for imports
+driver_dir = Path(__file__).parent.parent.parent
+if str(driver_dir) not in sys.path:
+    sys.path.insert(0, str(driver_dir))
@@ -0,0 +1,64 @@
+"""
+Unit tests for the CRC16 kernels.
+
+Every kernel is checked against a plain bit-serial CRC16 for all
+supported buffer types.
+"""
+
+import pytest
+
+from ccnet import crc
+from ccnet.constants import CRC_POLYNOMIAL
+
+
+def reference_crc16(data: bytes) -> int:
+    """Bit-serial CRC16 as described in the CCNET documentation."""
+    value = 0
+    for byte in data:
+        value ^= byte
+        for _ in range(8):
+            if value & 0x0001:
+                value = (value >> 1) ^ CRC_POLYNOMIAL
+            else:
+                value >>= 1
+    return value
+
+
+KERNELS = sorted(crc._CRC16_KERNELS.items())
+BUFFER_TYPES = [bytes, bytearray, memoryview]
+
+# Pseudo-random payload so every table entry gets exercised
+PAYLOAD = bytes((n * 73 + 41) & 0xFF for n in range(70))
+
+
+class TestCRCKernels:
+    """Tests for the native, table and nibble CRC16 kernels."""
+
+    def test_all_kernels_registered(self):
+        """Test that the portable kernels are always available."""
+        assert {"table", "nibble"} <= crc._CRC16_KERNELS.keys()
+
+    @pytest.mark.parametrize("buffer_type", BUFFER_TYPES)
+    @pytest.mark.parametrize("name, kernel", KERNELS)
+    @pytest.mark.parametrize("length", range(71))
+    def test_kernel_matches_reference(self, name, kernel, buffer_type, length):
+        """Test every kernel against the bit-serial reference."""
+        data = PAYLOAD[:length]
+        assert kernel(buffer_type(data)) == reference_crc16(data)
+
+    @pytest.mark.parametrize("buffer_type", BUFFER_TYPES)
+    @pytest.mark.parametrize("name, kernel", KERNELS)
+    def test_kernel_docstring_vector(self, name, kernel, buffer_type):
+        """Test the POLL packet vector from the verify_crc16 docstring."""
+        data = bytes([0x02, 0x03, 0x06, 0x33])
+        assert kernel(buffer_type(data)) == 0x81DA
+
+    @pytest.mark.parametrize("buffer_type", BUFFER_TYPES)
+    def test_public_helpers(self, buffer_type):
+        """Test the public helpers for every buffer type."""
+        data = bytes([0x02, 0x03, 0x06, 0x33])
+        packet = buffer_type(data + bytes([0xDA, 0x81]))
+
+        assert crc.calculate_crc16(buffer_type(data)) == bytes([0xDA, 0x81])
+        assert crc.verify_crc16(packet) is True
+        assert crc.append_crc(buffer_type(data)) == bytes(packet)
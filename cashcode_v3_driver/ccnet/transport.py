@@ -22,6 +22,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 from .constants import (
+    Command,
     SYNC_BYTE,
     DEFAULT_DEVICE_ADDRESS,
     RESPONSE_TIMEOUT_S,
@@ -29,14 +30,34 @@ from .constants import (
     MIN_PACKET_LENGTH,
     FLUSH_BUFFER_SIZE,
     FLUSH_TIMEOUT_S,
+    DRAIN_THRESHOLD_BYTES,
 )
-from .crc import calculate_crc16, verify_crc16
+from .crc import BytesLike, append_crc, verify_crc16
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# SYNC marker as a separator for StreamReader.readuntil
+_SYNC_BYTES = bytes((SYNC_BYTE,))
+
+
+# Commands sent without data; their frames are serialized ahead of time
+FIXED_COMMANDS: tuple[int, ...] = (
+    Command.ACK,
+    Command.NAK,
+    Command.RESET,
+    Command.GET_STATUS,
+    Command.POLL,
+    Command.STACK,
+    Command.RETURN,
+    Command.IDENTIFICATION,
+    Command.HOLD,
+    Command.GET_BILL_TABLE,
+)
+
+
+@dataclass(slots=True)
 class CCNETPacket:
     """
     Represents a CCNET protocol packet.
@@ -63,25 +84,30 @@ class CCNETPacket:
         Returns:
             Complete packet bytes ready to send.
         """
-        # Build packet without CRC
-        packet = bytes([
+        # Build packet without CRC (length inlined, data-less frames skip
+        # the concatenation)
+        data = self.data
+        packet = bytes((
             SYNC_BYTE,
             self.address,
-            self.length,
+            6 + len(data),
             self.command,
-        ]) + self.data
+        ))
+        if data:
+            packet += data
         
         # Append CRC
-        crc = calculate_crc16(packet)
-        return packet + crc
+        return append_crc(packet)
     
     @classmethod
-    def from_bytes(cls, data: bytes) -> Optional['CCNETPacket']:
+    def from_bytes(cls, data: BytesLike) -> Optional['CCNETPacket']:
         """
         Parse packet from received bytes.
         
         Args:
-            data: Raw bytes received from device.
+            data: Raw bytes received from device (any bytes-like object;
+                the packet data is copied out, so a view over a reused
+                buffer is fine).
             
         Returns:
             Parsed packet or None if invalid.
@@ -102,14 +128,72 @@ class CCNETPacket:
         length = data[2]
         command = data[3]
         
-        # Extract data (between CMD and CRC)
-        packet_data = data[4:-2] if length > 6 else b''
+        # Extract data (between CMD and CRC). Slicing bytes already copies;
+        # views must be copied so the packet outlives a reused buffer.
+        if length <= 6:
+            packet_data = b''
+        elif type(data) is bytes:
+            packet_data = data[4:-2]
+        else:
+            packet_data = bytes(data[4:-2])
         
         return cls(
             address=address,
             command=command,
             data=packet_data,
         )
+    
+    @classmethod
+    def from_parts(
+        cls,
+        address: int,
+        length: int,
+        remaining: bytes,
+        scratch: Optional[memoryview] = None,
+    ) -> Optional['CCNETPacket']:
+        """
+        Parse packet from an already framed header and body.
+        
+        The frame is assembled in the scratch buffer only for the CRC check;
+        the packet data is sliced straight from the received body.
+        
+        Args:
+            address: ADR byte of the frame.
+            length: LNG byte of the frame (total packet length).
+            remaining: Bytes after LNG (CMD + DATA + CRC).
+            scratch: Writable buffer of at least length bytes to assemble
+                the frame in. A new one is allocated if not given.
+            
+        Returns:
+            Parsed packet or None if invalid.
+        """
+        if length < 6 or len(remaining) != length - 3:
+            logger.warning(f"Packet length mismatch: LNG={length}, body={len(remaining)}")
+            return None
+        
+        frame = memoryview(bytearray(length)) if scratch is None else scratch[:length]
+        frame[0] = SYNC_BYTE
+        frame[1] = address
+        frame[2] = length
+        frame[3:] = remaining
+        
+        if not verify_crc16(frame):
+            logger.warning("CRC verification failed")
+            return None
+        
+        return cls(
+            address=address,
+            command=remaining[0],
+            data=remaining[1:-2],
+        )
+
+
+# Wire frames of the data-less commands for the default device address,
+# serialized once at import
+FIXED_FRAMES: dict[int, bytes] = {
+    command: CCNETPacket(DEFAULT_DEVICE_ADDRESS, command).to_bytes()
+    for command in FIXED_COMMANDS
+}
 
 
 class CCNETTransport:
@@ -118,17 +202,38 @@ class CCNETTransport:
     
     Handles async serial I/O, packet framing, and CRC validation.
     
+    Received bytes come through an asyncio.StreamReader. pyserial-asyncio
+    delivers serial reads via Protocol.data_received() and never calls
+    BufferedProtocol.get_buffer(), so there is no recv_into path to hook;
+    each frame is read with readexactly() and assembled once in a
+    reusable receive buffer.
+    
+    Writes are not locked by default: CCNET is request/response and the
+    driver's poll loop is the only sender. Pass lock_writes=True if
+    several coroutines may send at the same time.
+    
     Attributes:
         reader: Async serial reader.
         writer: Async serial writer.
         address: Device address.
     """
     
+    __slots__ = (
+        '_reader',
+        '_writer',
+        '_address',
+        '_lock',
+        '_rx_buf',
+        '_rx_view',
+        '_frame_cache',
+    )
+    
     def __init__(
         self,
         reader: asyncio.StreamReader,
         writer: asyncio.StreamWriter,
         address: int = DEFAULT_DEVICE_ADDRESS,
+        lock_writes: bool = False,
     ) -> None:
         """
         Initialize transport layer.
@@ -137,11 +242,27 @@ class CCNETTransport:
             reader: Async stream reader for serial port.
             writer: Async stream writer for serial port.
             address: Device address (default 0x03).
+            lock_writes: Serialize write + drain with an asyncio.Lock
+                (only needed with concurrent senders).
         """
         self._reader = reader
         self._writer = writer
         self._address = address
-        self._lock = asyncio.Lock()
+        self._lock: Optional[asyncio.Lock] = asyncio.Lock() if lock_writes else None
+        
+        # Complete frames (including CRC) for data-less commands; shared
+        # with FIXED_FRAMES for the default address
+        if address == DEFAULT_DEVICE_ADDRESS:
+            self._frame_cache = FIXED_FRAMES
+        else:
+            self._frame_cache = {
+                command: CCNETPacket(address, command).to_bytes()
+                for command in FIXED_COMMANDS
+            }
+        
+        # Reusable receive buffer, frames are assembled in place
+        self._rx_buf = bytearray(MAX_PACKET_LENGTH)
+        self._rx_view = memoryview(self._rx_buf)
     
     @property
     def address(self) -> int:
@@ -155,32 +276,63 @@ class CCNETTransport:
         Args:
             packet: Packet to send.
         """
-        data = packet.to_bytes()
-        hex_str = ' '.join(f'{b:02X}' for b in data)
-        logger.debug(f"TX: {hex_str}")
+        await self.send_raw(packet.to_bytes())
+    
+    async def send_raw(self, frame: bytes, drain: bool = True) -> None:
+        """
+        Send an already serialized frame (including CRC) to the device.
+        
+        Args:
+            frame: Complete packet bytes.
+            drain: Wait for the write buffer to flush. Pass False when
+                another frame follows shortly or the device's answer
+                confirms the write anyway; the frame is still drained
+                once more than DRAIN_THRESHOLD_BYTES are pending.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("TX: %s", frame.hex(' ').upper())
+        
+        writer = self._writer
+        if self._lock is None:
+            writer.write(frame)
+            if drain or writer.transport.get_write_buffer_size() > DRAIN_THRESHOLD_BYTES:
+                await writer.drain()
+            return
         
         async with self._lock:
-            self._writer.write(data)
-            await self._writer.drain()
+            writer.write(frame)
+            if drain or writer.transport.get_write_buffer_size() > DRAIN_THRESHOLD_BYTES:
+                await writer.drain()
     
     async def send_command(
         self,
         command: int,
         data: bytes = b'',
+        drain: bool = True,
     ) -> None:
         """
         Send a command to the device.
         
+        Data-less commands from FIXED_COMMANDS are sent from the frame
+        cache without building a packet.
+        
         Args:
             command: Command byte.
             data: Optional command data.
+            drain: Wait for the write buffer to flush (see send_raw).
         """
+        if not data:
+            frame = self._frame_cache.get(command)
+            if frame is not None:
+                await self.send_raw(frame, drain)
+                return
+        
         packet = CCNETPacket(
             address=self._address,
             command=command,
             data=data,
         )
-        await self.send_packet(packet)
+        await self.send_raw(packet.to_bytes(), drain)
     
     async def receive_packet(
         self,
@@ -198,37 +350,31 @@ class CCNETTransport:
             Received packet or None if timeout/error.
         """
         try:
-            # Find SYNC byte
-            sync_found = False
-            max_attempts = 10
-            
-            for _ in range(max_attempts):
-                byte_data = await asyncio.wait_for(
-                    self._reader.read(1),
+            # Find SYNC byte; readuntil scans the reader's buffer in C and
+            # returns everything up to and including the SYNC byte
+            try:
+                skipped = await asyncio.wait_for(
+                    self._reader.readuntil(_SYNC_BYTES),
                     timeout=timeout,
                 )
-                
-                if len(byte_data) == 0:
-                    logger.warning("No data received (EOF)")
-                    return None
-                
-                if byte_data[0] == SYNC_BYTE:
-                    sync_found = True
-                    break
-                else:
-                    logger.debug(f"Skipping byte: 0x{byte_data[0]:02X}")
-            
-            if not sync_found:
+            except asyncio.IncompleteReadError:
+                logger.warning("No data received (EOF)")
+                return None
+            except asyncio.LimitOverrunError:
                 logger.warning("SYNC byte not found")
+                await self._flush_buffer()
                 return None
             
-            # Read ADDRESS and LENGTH
-            addr_len = await asyncio.wait_for(
-                self._reader.read(2),
-                timeout=timeout,
-            )
+            if len(skipped) > 1 and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Skipped %d bytes: %s", len(skipped) - 1, skipped[:-1].hex(' ').upper())
             
-            if len(addr_len) < 2:
+            # Read ADDRESS and LENGTH
+            try:
+                addr_len = await asyncio.wait_for(
+                    self._reader.readexactly(2),
+                    timeout=timeout,
+                )
+            except asyncio.IncompleteReadError:
                 logger.warning("Failed to read ADDRESS and LENGTH")
                 return None
             
@@ -249,29 +395,40 @@ class CCNETTransport:
                 await self._flush_buffer()
                 return None
             
-            # Build header
-            header = bytes([SYNC_BYTE, address, total_length])
-            
             # Read remaining bytes (CMD + DATA + CRC)
             remaining_length = total_length - 3
-            remaining = await asyncio.wait_for(
-                self._reader.read(remaining_length),
-                timeout=timeout,
-            )
-            
-            if len(remaining) < remaining_length:
+            try:
+                remaining = await asyncio.wait_for(
+                    self._reader.readexactly(remaining_length),
+                    timeout=timeout,
+                )
+            except asyncio.IncompleteReadError as e:
                 logger.warning(
                     f"Incomplete packet: expected {remaining_length}, "
-                    f"got {len(remaining)}"
+                    f"got {len(e.partial)}"
                 )
                 return None
             
-            # Combine and parse
-            complete_data = header + remaining
-            hex_str = ' '.join(f'{b:02X}' for b in complete_data)
-            logger.debug(f"RX: {hex_str}")
+            # The frame is assembled in the receive buffer for the CRC check
+            packet = CCNETPacket.from_parts(
+                address,
+                total_length,
+                remaining,
+                self._rx_view,
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                if packet is None:
+                    # A rejected frame may never have reached the receive buffer
+                    logger.debug(
+                        "RX (rejected): %02X %s %s",
+                        SYNC_BYTE,
+                        addr_len.hex(' ').upper(),
+                        remaining.hex(' ').upper(),
+                    )
+                else:
+                    logger.debug("RX: %s", self._rx_view[:total_length].hex(' ').upper())
             
-            return CCNETPacket.from_bytes(complete_data)
+            return packet
             
         except asyncio.TimeoutError:
             logger.debug("Receive timeout")
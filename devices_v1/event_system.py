@@ -36,33 +36,27 @@ class EventConsumer:
             self.handlers[event_type] = []
         self.handlers[event_type].append(handler)
 
-    async def _consume_one(self):
-        """Consume a single event and schedule the next consumption."""
-        if not self.is_consuming:
-            return
-
+    async def _consume_loop(self):
+        """Consume events until consumption is stopped."""
         try:
-            event = await self.event_queue.get()
-            event_type = event.get("type")
-
-            if event_type in self.handlers:
-                # Process all handlers with functional approach
-                handlers = self.handlers[event_type]
-                async_handlers = [h for h in handlers if asyncio.iscoroutinefunction(h)]
-                sync_handlers = [h for h in handlers if not asyncio.iscoroutinefunction(h)]
+            while self.is_consuming:
+                event = await self.event_queue.get()
+                event_type = event.get("type")
 
-                # Execute async handlers concurrently
-                if async_handlers:
-                    await asyncio.gather(*[handler(event) for handler in async_handlers])
+                if event_type in self.handlers:
+                    # Process all handlers with functional approach
+                    handlers = self.handlers[event_type]
+                    async_handlers = [h for h in handlers if asyncio.iscoroutinefunction(h)]
+                    sync_handlers = [h for h in handlers if not asyncio.iscoroutinefunction(h)]
 
-                # Execute sync handlers
-                [handler(event) for handler in sync_handlers]
+                    # Execute async handlers concurrently
+                    if async_handlers:
+                        await asyncio.gather(*[handler(event) for handler in async_handlers])
 
-            self.event_queue.task_done()
+                    # Execute sync handlers
+                    [handler(event) for handler in sync_handlers]
 
-            # Schedule next consumption recursively
-            if self.is_consuming:
-                self.consume_task = asyncio.create_task(self._consume_one())
+                self.event_queue.task_done()
 
         except asyncio.CancelledError:
             pass
@@ -73,7 +67,7 @@ class EventConsumer:
             return
 
         self.is_consuming = True
-        self.consume_task = asyncio.create_task(self._consume_one())
+        self.consume_task = asyncio.create_task(self._consume_loop())
 
     async def stop_consuming(self):
         """Stop consuming events."""
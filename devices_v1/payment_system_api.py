@@ -11,6 +11,12 @@ from redis_error_handler import redis_error_handler
 from send_to_ws import send_to_ws
 
 
+# Номинал монеты (копейки) по коду из события COIN_CREDIT
+_COIN_AMOUNTS = {1375731712: 100, 1375731713: 500, 1375731715: 1000}
+# Длина списка value, при которой код 100 копеек означает монету 2 рубля
+_TWO_RUB_VALUE_LEN = 200
+
+
 class PaymentSystemAPI:
     """Api для взаимодействия с наличной системой оплаты."""
     def __init__(self, redis):
@@ -372,14 +378,12 @@ class PaymentSystemAPI:
         """Обработчик принятия монеты."""
         logger.info(f"on_coin_credit event: {event}")
         try:
-            coin_data = event.get('info').get("value")[0]
-            num = coin_data.get("value")
-            amount_map = {1375731712: 100, 1375731713: 500, 1375731715: 1000}
+            values = event['info']['value']
+            num = values[0].get("value")
+            amount = _COIN_AMOUNTS.get(num)
 
-            if len(event.get('info').get("value")) == 200 and amount_map.get(num) == 100:
+            if amount == 100 and len(values) == _TWO_RUB_VALUE_LEN:
                 amount = 200
-            else:
-                amount = amount_map.get(num, None)
 
             if amount is None:
                 logger.error(f"Ошибка, неизвестная монета: {num}")
@@ -14,8 +14,9 @@ from redis.asyncio import Redis
 
 from application.payment_service import PaymentService
 from application.device_service import DeviceService
-from event_system import EventPublisher, EventConsumer, EventType
+from event_system import EventPublisher, EventConsumer, EventQueue, EventType
 from loggers import logger
+from send_to_ws import close_connections
 
 
 class PaymentSystemFacade:
@@ -42,7 +43,7 @@ class PaymentSystemFacade:
         self._redis = redis
 
         # Event system
-        self._event_queue: asyncio.Queue = asyncio.Queue()
+        self._event_queue: EventQueue = EventQueue()
         self._event_publisher = EventPublisher(self._event_queue)
         self._event_consumer = EventConsumer(self._event_queue)
 
@@ -94,6 +95,8 @@ class PaymentSystemFacade:
         try:
             await self._device_service.shutdown()
             await self._event_consumer.stop_consuming()
+            # Close the frontend connection once no more events can be sent
+            await close_connections()
             logger.info("Payment system shut down successfully")
         except Exception as e:
             logger.error(f"Error during shutdown: {e}")
@@ -26,7 +26,7 @@ from infrastructure.redis_repository import (
     PaymentStateRepository,
 )
 from infrastructure.settings import get_settings
-from event_system import EventPublisher, EventType
+from event_system import Event, EventPublisher, EventType
 from send_to_ws import send_to_ws
 from loggers import logger
 
@@ -185,14 +185,14 @@ class PaymentService:
 
         return result.to_dict()
 
-    async def handle_bill_accepted(self, event: dict[str, Any]) -> None:
+    async def handle_bill_accepted(self, event: Event) -> None:
         """
         Handle bill acceptance event.
 
         Args:
-            event: Event dictionary with bill value.
+            event: Event with bill value.
         """
-        value = event.get("value", 0)
+        value = event.data.get("value", 0)
         if value <= 0:
             return
 
@@ -209,14 +209,14 @@ class PaymentService:
             data={"bill_value": value, "collected_amount": collected},
         )
 
-    async def handle_coin_accepted(self, event: dict[str, Any]) -> None:
+    async def handle_coin_accepted(self, event: Event) -> None:
         """
         Handle coin acceptance event.
 
         Args:
-            event: Event dictionary with coin value.
+            event: Event with coin value.
         """
-        value = event.get("value", 0)
+        value = event.data.get("value", 0)
         if value <= 0:
             return
 
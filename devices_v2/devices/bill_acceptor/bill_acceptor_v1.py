@@ -1,4 +1,8 @@
 import asyncio
+import logging
+import time
+from binascii import crc_hqx
+from collections import deque
 
 from redis.asyncio import Redis
 import serial_asyncio
@@ -8,8 +12,64 @@ from configs import bill_acceptor_config
 from loggers import logger
 
 
+# CRC16 CCNET (полином 0x8408, отраженный) совпадает с CRC-CCITT из binascii
+# (0x1021, C-реализация) на данных с обратным порядком бит в каждом байте
+_BIT_REVERSE = bytes(int(f"{i:08b}"[::-1], 2) for i in range(256))
+
+
+def calculate_crc(data: bytes) -> bytes:
+    """Расчет CRC."""
+    crc = crc_hqx(data.translate(_BIT_REVERSE), 0)
+    return bytes((_BIT_REVERSE[crc >> 8], _BIT_REVERSE[crc & 0xFF]))
+
+
+# Таблицы из конфигурации, привязанные один раз
+_STATES = bill_acceptor_config.STATES
+# Номиналы по коду купюры как int (код в ответе - один байт)
+_BILL_CODES = {code[0]: amount for code, amount in bill_acceptor_config.BILL_CODES_V1.items()}
+_REJECT_STATES = frozenset({0x1c, 0x43, 0x44, 0x45, 0x46, 0x47})
+# Таймаут на чтение одного сообщения, секунды
+_READ_TIMEOUT = 1.5
+
+
+# Команды без переменных данных: CRC считается один раз при импорте
+CMD_PULL_WITH_CRC = bill_acceptor_config.CMD_PULL + calculate_crc(bill_acceptor_config.CMD_PULL)
+CMD_RESET_DEVICE_WITH_CRC = (
+    bill_acceptor_config.CMD_RESET_DEVICE + calculate_crc(bill_acceptor_config.CMD_RESET_DEVICE)
+)
+CMD_DISABLE_WITH_CRC = bill_acceptor_config.CMD_DISABLE + calculate_crc(bill_acceptor_config.CMD_DISABLE)
+CMD_STACK_WITH_CRC = bill_acceptor_config.CMD_STACK + calculate_crc(bill_acceptor_config.CMD_STACK)
+CMD_ACCEPT_ALL_BILLS_WITH_CRC = (
+    bill_acceptor_config.CMD_ACCEPT_ALL_BILLS + calculate_crc(bill_acceptor_config.CMD_ACCEPT_ALL_BILLS)
+)
+
+
 class BillAcceptor:
     """Интерфейс для коммуникации с купюроприемником."""
+
+    __slots__ = (
+        'port',
+        'publisher',
+        'redis',
+        'reader',
+        'writer',
+        '_rx_buf',
+        '_active',
+        '_accepting_enabled',
+        'target_amount',
+        'last_processed_bill',
+        'bill_processed',
+        'max_bill_count',
+        'state_history',
+        '_stack_sent',
+        'transaction_counter',
+        '_reader_task',
+        '_force_stop',
+        '_escrow_timestamp',
+        '_escrow_timeout',
+        '_dispatch',
+    )
+
     def __init__(self, port: str, publisher: EventPublisher, redis: Redis):
         self.port = port
         self.publisher = publisher
@@ -18,7 +78,7 @@ class BillAcceptor:
         # коммуникация
         self.reader = None
         self.writer = None
-        self._msg_queue = asyncio.Queue()
+        self._rx_buf = bytearray()
 
         # отслеживание состояний
         self._active = False
@@ -27,15 +87,14 @@ class BillAcceptor:
         self.last_processed_bill = None
         self.bill_processed = False
         self.max_bill_count = None
-        self.state_history = []
+        self.state_history = deque(maxlen=5)
         self._stack_sent = False
 
         # Счетчик транзакций
         self.transaction_counter = 0
 
-        # Ссылки на задачи
+        # Ссылка на задачу опроса
         self._reader_task = None
-        self._processor_task = None
 
         # НОВЫЙ флаг для принудительной остановки
         self._force_stop = False
@@ -43,6 +102,13 @@ class BillAcceptor:
         self._escrow_timestamp = None
         self._escrow_timeout = 3.0  # 10 секунд на обработку купюры
 
+        # Обработчики состояний из ответа на POLL
+        self._dispatch = {
+            0x80: self._on_escrow,
+            0x81: self._on_stacked,
+            **{state: self._on_reject for state in _REJECT_STATES},
+        }
+
 
     async def initialize(self):
         """Инициализация."""
@@ -54,9 +120,9 @@ class BillAcceptor:
                 url=self.port,
                 baudrate=9600
             )
-            poll_cmd = bill_acceptor_config.CMD_PULL
-            poll_cmd += self._calculate_crc(poll_cmd)
-            self.writer.write(poll_cmd)
+            self._enable_low_latency()
+            self._rx_buf.clear()
+            self.writer.write(CMD_PULL_WITH_CRC)
             await self.writer.drain()
             response = await self._read_ccnet_message()
             if not response:
@@ -69,11 +135,21 @@ class BillAcceptor:
             return False
 
 
+    def _enable_low_latency(self):
+        """Включение ASYNC_LOW_LATENCY на порту (таймер USB-адаптера 1 мс вместо 16 мс)."""
+        serial = self.writer.get_extra_info('serial')
+        try:
+            serial.set_low_latency_mode(True)
+        except (AttributeError, ValueError) as e:
+            # Не Linux или порт без поддержки TIOCSSERIAL
+            logger.debug(f"Low latency режим недоступен для {self.port}: {e}")
+
+
     def _reset_state(self):
         """Полный сброс внутреннего состояния"""
         self.last_processed_bill = None
         self.bill_processed = False
-        self.state_history = []
+        self.state_history.clear()
         self._stack_sent = False
 
 
@@ -82,24 +158,15 @@ class BillAcceptor:
         try:
             self._reset_state()
 
-            reset_cmd = bill_acceptor_config.CMD_RESET_DEVICE
-            reset_cmd += self._calculate_crc(reset_cmd)
-            self.writer.write(reset_cmd)
+            self.writer.write(CMD_RESET_DEVICE_WITH_CRC)
             await self.writer.drain()
 
             # После reset отправляем DISABLE
-            disable_cmd = bill_acceptor_config.CMD_DISABLE
-            disable_cmd += self._calculate_crc(disable_cmd)
-            self.writer.write(disable_cmd)
+            self.writer.write(CMD_DISABLE_WITH_CRC)
             await self.writer.drain()
 
-            # Очистка очереди
-            while not self._msg_queue.empty():
-                try:
-                    self._msg_queue.get_nowait()
-                    self._msg_queue.task_done()
-                except asyncio.QueueEmpty:
-                    break
+            # Очистка непрочитанных ответов
+            self._rx_buf.clear()
 
             return True
         except Exception as e:
@@ -117,9 +184,8 @@ class BillAcceptor:
         self._accepting_enabled = True
         self._force_stop = False
 
-        # Запускаем задачи
+        # Запускаем задачу опроса
         self._reader_task = asyncio.create_task(self._serial_reader_task())
-        self._processor_task = asyncio.create_task(self._message_processor_task())
 
         # Включаем прием купюр
         await self._enable_all_bills()
@@ -136,9 +202,7 @@ class BillAcceptor:
 
         # Отправляем DISABLE
         try:
-            disable_cmd = bill_acceptor_config.CMD_DISABLE
-            disable_cmd += self._calculate_crc(disable_cmd)
-            self.writer.write(disable_cmd)
+            self.writer.write(CMD_DISABLE_WITH_CRC)
             await self.writer.drain()
             logger.info("Disable command sent")
         except Exception as e:
@@ -148,125 +212,78 @@ class BillAcceptor:
         self._active = False
         logger.info(f"Set _active = False")
 
-        # Отменяем задачи ПРИНУДИТЕЛЬНО
-        tasks_to_cancel = []
+        # Отменяем задачу ПРИНУДИТЕЛЬНО
         if self._reader_task and not self._reader_task.done():
-            tasks_to_cancel.append(self._reader_task)
             logger.info("Cancelling reader task")
-        if self._processor_task and not self._processor_task.done():
-            tasks_to_cancel.append(self._processor_task)
-            logger.info("Cancelling processor task")
-
-        if tasks_to_cancel:
-            for task in tasks_to_cancel:
-                task.cancel()
+            self._reader_task.cancel()
 
             # Ждем отмены
             try:
-                await asyncio.gather(*tasks_to_cancel, return_exceptions=True)
+                await asyncio.gather(self._reader_task, return_exceptions=True)
             except Exception as e:
                 logger.error(f"Error cancelling tasks: {e}")
 
-        # Очистка очереди (вроде и нихуя не делает но лучше перезбдеть)
-        while not self._msg_queue.empty():
-            try:
-                self._msg_queue.get_nowait()
-                self._msg_queue.task_done()
-            except asyncio.QueueEmpty:
-                break
+        # Очистка непрочитанных ответов
+        self._rx_buf.clear()
 
         self._reset_state()
         self._reader_task = None
-        self._processor_task = None
         logger.info("=== Bill acceptor STOPPED ===")
 
 
-    def _calculate_crc(self, data: bytes) -> bytes:
-        """Расчет CRC."""
-        crc = 0
-        for byte in data:
-            crc ^= byte
-            for _ in range(8):
-                if crc & 0x0001:
-                    crc = (crc >> 1) ^ bill_acceptor_config.CRC_POLYNOMIAL
-                else:
-                    crc = crc >> 1
-        return crc.to_bytes(2, 'little')
-
-
-    def _verify_checksum(self, response: bytes) -> bool:
-        """Валидация CRC ответа."""
-        if len(response) < 6:
-            return False
-        return True
-
     async def _read_ccnet_message(self):
         """Чтение сообщения по протоколу CCNET."""
+        # Порт читается блоками, кадр выделяется из накопленного буфера.
+        # Один таймаут на все сообщение, а не на каждое чтение
+        buf = self._rx_buf
         try:
-            # КРИТИЧНО: Ищем SYNC байт
-            sync_found = False
-            max_sync_attempts = 10
-
-            for _ in range(max_sync_attempts):
-                header = await asyncio.wait_for(self.reader.read(1), timeout=1.0)
-                if len(header) == 0:
-                    return None
-
-                if header[0] == 0x02:  # Правильный SYNC байт
-                    sync_found = True
-                    break
-                else:
-                    logger.warning(f"Пропущен неверный байт: 0x{header[0]:x}")
-
-            if not sync_found:
-                logger.error("SYNC байт не найден после нескольких попыток")
-                return None
-
-            # Читаем ADDRESS и LENGTH
-            addr_len = await asyncio.wait_for(self.reader.read(2), timeout=1.0)
-            if len(addr_len) < 2:
-                logger.error("Не удалось прочитать ADDRESS и LENGTH")
-                return None
-
-            address = addr_len[0]
-            total_length = addr_len[1]
-
-            # Валидация
-            if address != 0x03:
-                logger.error(f"Неверный ADDRESS: 0x{address:x}, ожидалось 0x03")
-                return None
-
-            if total_length < 3 or total_length > 50:
-                logger.warning(f"Странная длина сообщения: {total_length}")
-                # Очистка буфера
-                try:
-                    junk = await asyncio.wait_for(self.reader.read(100), timeout=0.1)
-                    logger.error(f"!!! ОЧИЩЕНО {len(junk)} БАЙТ: {[f'0x{b:x}' for b in junk]}")
-                except:
-                    pass
-                return None
-
-            # Формируем header
-            header = bytes([0x02, address, total_length])
-
-            # Читаем остаток сообщения
-            remaining_length = total_length - 3
-            if remaining_length > 0:
-                remaining = await asyncio.wait_for(
-                    self.reader.read(remaining_length),
-                    timeout=1.0
-                )
-                if len(remaining) < remaining_length:
-                    logger.error(
-                        f"Неполное сообщение: ожидалось {remaining_length}, получено {len(remaining)}")
-                    return None
-                complete_message = header + remaining
-            else:
-                complete_message = header
-
-            return complete_message
+            async with asyncio.timeout(_READ_TIMEOUT):
+                while True:
+                    # КРИТИЧНО: Ищем SYNC байт
+                    sync = buf.find(0x02)
+                    if sync != 0 and buf:
+                        skipped = len(buf) if sync < 0 else sync
+                        logger.warning(f"Пропущено неверных байт: {skipped}")
+                        del buf[:skipped]
+
+                    if len(buf) >= 3:
+                        address = buf[1]
+                        total_length = buf[2]
+
+                        # Валидация
+                        if address != 0x03:
+                            logger.error(f"Неверный ADDRESS: 0x{address:x}, ожидалось 0x03")
+                            del buf[:3]
+                            return None
+
+                        # Минимальный кадр: SYNC + ADR + LNG + CMD + CRC(2)
+                        if total_length < 6 or total_length > 50:
+                            logger.warning(f"Странная длина сообщения: {total_length}")
+                            # Очистка буфера
+                            logger.error(f"!!! ОЧИЩЕНО {len(buf)} БАЙТ: {buf.hex(' ')}")
+                            buf.clear()
+                            return None
+
+                        if len(buf) >= total_length:
+                            complete_message = bytes(buf[:total_length])
+                            del buf[:total_length]
+                            if calculate_crc(complete_message[:-2]) != complete_message[-2:]:
+                                logger.warning(f"Неверный CRC: {complete_message.hex(' ')}")
+                                return None
+                            return complete_message
+
+                    chunk = await self.reader.read(256)
+                    if not chunk:
+                        if buf:
+                            logger.error(f"Неполное сообщение: получено {len(buf)} байт")
+                            buf.clear()
+                        return None
+                    buf += chunk
 
         except asyncio.TimeoutError:
+            if buf:
+                logger.error(f"Неполное сообщение: получено {len(buf)} байт")
+                buf.clear()
             return None
         except Exception as e:
             logger.error(f"Ошибка чтения: {e}")
@@ -275,8 +292,13 @@ class BillAcceptor:
 
     async def _check_bill_acceptor_capacity(self) -> bool:
         """Проверка на переполненность купюр."""
-        count = int(await self.redis.get("bill_count") or 0)
-        self.max_bill_count = int(await self.redis.get('max_bill_count') or 0)
+        # Оба значения за один запрос к Redis
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.get("bill_count")
+            pipe.get("max_bill_count")
+            count, max_bill_count = await pipe.execute()
+        count = int(count or 0)
+        self.max_bill_count = int(max_bill_count or 0)
         if count >= self.max_bill_count:
             logger.error("Купюроприемник переполнен")
             return False
@@ -285,9 +307,7 @@ class BillAcceptor:
 
     async def _enable_all_bills(self):
         """Активация режима приема всех купюр."""
-        enable_cmd = bill_acceptor_config.CMD_ACCEPT_ALL_BILLS
-        enable_cmd += self._calculate_crc(enable_cmd)
-        self.writer.write(enable_cmd)
+        self.writer.write(CMD_ACCEPT_ALL_BILLS_WITH_CRC)
         await self.writer.drain()
 
     async def _serial_reader_task(self):
@@ -297,17 +317,20 @@ class BillAcceptor:
             while self._active and not self._force_stop:
                 try:
                     # Отправляем POLL
-                    poll_cmd = bill_acceptor_config.CMD_PULL
-                    poll_cmd += self._calculate_crc(poll_cmd)
-                    self.writer.write(poll_cmd)
+                    self.writer.write(CMD_PULL_WITH_CRC)
                     await self.writer.drain()
 
-                    # Читаем ответ
+                    # Читаем и сразу обрабатываем ответ
                     response = await self._read_ccnet_message()
                     if response:
-                        await self._msg_queue.put(response)
+                        try:
+                            await self._process_response(response)
+                        except Exception as e:
+                            if self._active:
+                                logger.error(f"Processor error: {e}")
 
-                    await asyncio.sleep(0.2)  # Обычная скорость
+                    # Пока купюра в обработке (STACK отправлен) опрашиваем чаще
+                    await asyncio.sleep(0.05 if self._stack_sent else 0.15)
 
                 except asyncio.CancelledError:
                     logger.info("Reader task cancelled")
@@ -320,41 +343,21 @@ class BillAcceptor:
             logger.info("Reader task STOPPED")
 
 
-    async def _message_processor_task(self):
-        """Обработка сообщений из очереди."""
-        logger.info("Processor task STARTED")
-        try:
-            while self._active and not self._force_stop:
-                try:
-                    data = await asyncio.wait_for(self._msg_queue.get(), timeout=0.5)
-                    await self._process_response(data)
-                    self._msg_queue.task_done()
-                except asyncio.TimeoutError:
-                    continue
-                except asyncio.CancelledError:
-                    logger.info("Processor task cancelled")
-                    break
-                except Exception as e:
-                    if self._active:
-                        logger.error(f"Processor error: {e}")
-        finally:
-            logger.info("Processor task STOPPED")
-
     async def _process_response(self, data: bytes) -> None:
-        """Процесс обработки задач из очереди."""
+        """Обработка ответа на POLL."""
         if len(data) < 6:
             return
-        elif not self._verify_checksum(data):
-            return
 
         state = data[3]
-        state_name = bill_acceptor_config.STATES.get(state, f"UNKNOWN(0x{state:x})")
-        logger.debug(f"Состояние купюроприемника: {state_name}")
-        logger.debug(f'Data: {[f"0x{b:x}" for b in data]}')
+        # Форматируем отладочный вывод только при включенном DEBUG
+        if logger.isEnabledFor(logging.DEBUG):
+            state_name = _STATES.get(state, f"UNKNOWN(0x{state:x})")
+            logger.debug(f"Состояние купюроприемника: {state_name}")
+            logger.debug(f'Data: {[f"0x{b:x}" for b in data]}')
 
         # Проверка таймаута ESCROW
         if self._stack_sent and self._escrow_timestamp:
-            elapsed = asyncio.get_event_loop().time() - self._escrow_timestamp
+            elapsed = time.monotonic() - self._escrow_timestamp
             if elapsed > self._escrow_timeout:
                 logger.error(f"!!! ESCROW TIMEOUT ({elapsed:.1f}s) - сбрасываем состояние")
                 self._stack_sent = False
@@ -364,68 +367,66 @@ class BillAcceptor:
                 await self.reset_device()
                 return
 
-        # Добавляем состояние в историю
+        # Добавляем состояние в историю (deque сам вытесняет старые)
         self.state_history.append(state)
-        if len(self.state_history) > 5:
-            self.state_history.pop(0)
-
-        if state == 0x15:
-            pass
-
-        # Обработка ESCROW
-        if state == 0x80:
-            if not self._stack_sent:
-                bill_code = data[4] if len(data) > 4 else 0
-                logger.info(f"!!! ESCROW обнаружен, код купюры: 0x{bill_code:x}, отправляем STACK")
-                # Отправляем STACK
-                stack_cmd = bill_acceptor_config.CMD_STACK
-                stack_cmd += self._calculate_crc(stack_cmd)
-                self.writer.write(stack_cmd)
-                await self.writer.drain()
-                self._stack_sent = True
-                self._escrow_timestamp = asyncio.get_event_loop().time()
-
-                # Сохраняем код купюры
-                self.last_processed_bill = bytes([bill_code])
-
-                logger.info("!!! STACK команда отправлена, ожидаем STACKED")
-            else:
-                logger.debug(f"ESCROW (повтор) - купюра обрабатывается, ждем STACKED...")
-
-        # Обработка STACKED
-        elif state == 0x81:
-            logger.info("!!! STACKED получен!")
-
-            if not self.bill_processed and self._stack_sent:
-                if self.last_processed_bill:
-                    bill_code = self.last_processed_bill
-                    amount = bill_acceptor_config.BILL_CODES_V1.get(bill_code, 0)
-
-                    logger.info(f'!!! Код принятой купюры: {bill_code}, сумма: {amount / 100} RUB')
-
-                    if self._accepting_enabled:
-                        logger.info(f"!!! Публикуем BILL_ACCEPTED event, amount={amount}")
-                        await self.publisher.publish(EventType.BILL_ACCEPTED, value=amount)
-                        await self.redis.incr("bill_count")
-                        self.bill_processed = True
-                        self.transaction_counter += 1
-                        logger.info(
-                            f"!!! Bill accepted: {amount / 100} RUB, transaction #{self.transaction_counter}")
-                    else:
-                        logger.warning(f"!!! Bill stacked but accepting disabled: {bill_code}")
+
+        handler = self._dispatch.get(state)
+        if handler:
+            await handler(data)
+
+    async def _on_escrow(self, data: bytes) -> None:
+        """Обработка ESCROW."""
+        if not self._stack_sent:
+            bill_code = data[4]
+            logger.info(f"!!! ESCROW обнаружен, код купюры: 0x{bill_code:x}, отправляем STACK")
+            # Отправляем STACK
+            self.writer.write(CMD_STACK_WITH_CRC)
+            await self.writer.drain()
+            self._stack_sent = True
+            self._escrow_timestamp = time.monotonic()
+
+            # Сохраняем код купюры
+            self.last_processed_bill = bill_code
+
+            logger.info("!!! STACK команда отправлена, ожидаем STACKED")
+        else:
+            logger.debug(f"ESCROW (повтор) - купюра обрабатывается, ждем STACKED...")
+
+    async def _on_stacked(self, data: bytes) -> None:
+        """Обработка STACKED."""
+        logger.info("!!! STACKED получен!")
+
+        if not self.bill_processed and self._stack_sent:
+            if self.last_processed_bill is not None:
+                bill_code = self.last_processed_bill
+                amount = _BILL_CODES.get(bill_code, 0)
+
+                logger.info(f'!!! Код принятой купюры: 0x{bill_code:x}, сумма: {amount / 100} RUB')
+
+                if self._accepting_enabled:
+                    logger.info(f"!!! Публикуем BILL_ACCEPTED event, amount={amount}")
+                    await self.publisher.publish(EventType.BILL_ACCEPTED, value=amount)
+                    await self.redis.incr("bill_count")
+                    self.bill_processed = True
+                    self.transaction_counter += 1
+                    logger.info(
+                        f"!!! Bill accepted: {amount / 100} RUB, transaction #{self.transaction_counter}")
                 else:
-                    logger.error("!!! STACKED получен, но код купюры не был сохранен!")
-
-            # Сбрасываем флаги
-            self._stack_sent = False
-            self.bill_processed = False
-            self.last_processed_bill = None
-            self._escrow_timestamp = None
-
-        # Обработка rejection
-        elif state in [0x1c, 0x43, 0x44, 0x45, 0x46, 0x47]:
-            logger.warning(f"Bill rejected, state: {state_name}")
-            self._stack_sent = False
-            self.bill_processed = False
-            self.last_processed_bill = None
-            self._escrow_timestamp = None
\ No newline at end of file
+                    logger.warning(f"!!! Bill stacked but accepting disabled: 0x{bill_code:x}")
+            else:
+                logger.error("!!! STACKED получен, но код купюры не был сохранен!")
+
+        # Сбрасываем флаги
+        self._stack_sent = False
+        self.bill_processed = False
+        self.last_processed_bill = None
+        self._escrow_timestamp = None
+
+    async def _on_reject(self, data: bytes) -> None:
+        """Обработка rejection."""
+        state = data[3]
+        logger.warning(f"Bill rejected, state: {_STATES.get(state, f'UNKNOWN(0x{state:x})')}")
+        self._stack_sent = False
+        self.bill_processed = False
+        self.last_processed_bill = None
+        self._escrow_timestamp = None
@@ -0,0 +1,11 @@
+"""
+Pytest configuration for bill acceptor tests.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the devices_v2 directory to the path for imports
+devices_v2_dir = Path(__file__).parent.parent.parent.parent
+if str(devices_v2_dir) not in sys.path:
+    sys.path.insert(0, str(devices_v2_dir))
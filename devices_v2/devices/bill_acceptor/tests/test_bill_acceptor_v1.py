@@ -0,0 +1,150 @@
+"""
+Unit tests for CCNET message framing in the v1 bill acceptor.
+
+A fake reader hands out prepared chunks, so each test controls exactly
+how the frames are split across reads.
+"""
+
+import asyncio
+import pytest
+
+from devices.bill_acceptor import bill_acceptor_v1
+from devices.bill_acceptor.bill_acceptor_v1 import BillAcceptor, calculate_crc
+
+
+def make_frame(payload: bytes) -> bytes:
+    """Build a CCNET frame (SYNC + ADR + LNG + payload + CRC)."""
+    header = bytes([0x02, 0x03, len(payload) + 5])
+    return header + payload + calculate_crc(header + payload)
+
+
+IDLING = make_frame(bytes([0x14]))
+ESCROW = make_frame(bytes([0x80, 0x04]))
+
+
+class FakeReader:
+    """StreamReader stand-in returning one prepared chunk per read."""
+
+    def __init__(self, *chunks: bytes):
+        self.chunks = list(chunks)
+        self.reads = 0
+
+    async def read(self, n: int) -> bytes:
+        self.reads += 1
+        if not self.chunks:
+            # Device is silent: wait for the caller's timeout
+            await asyncio.Event().wait()
+        return self.chunks.pop(0)
+
+
+@pytest.fixture
+def acceptor():
+    """Bill acceptor with no port, publisher or Redis attached."""
+    return BillAcceptor("/dev/null", publisher=None, redis=None)
+
+
+@pytest.fixture
+def short_timeout(monkeypatch):
+    """Shorten the per-message read timeout."""
+    monkeypatch.setattr(bill_acceptor_v1, "_READ_TIMEOUT", 0.05)
+
+
+class TestReadCcnetMessage:
+    """Tests for BillAcceptor._read_ccnet_message."""
+
+    def test_make_frame_matches_poll_command(self):
+        """Test the frame helper against the precomputed POLL frame."""
+        assert make_frame(bytes([0x33])) == bill_acceptor_v1.CMD_PULL_WITH_CRC
+
+    @pytest.mark.asyncio
+    async def test_single_frame(self, acceptor):
+        """Test a frame delivered in one read."""
+        acceptor.reader = FakeReader(IDLING)
+
+        assert await acceptor._read_ccnet_message() == IDLING
+        assert acceptor._rx_buf == b""
+
+    @pytest.mark.asyncio
+    async def test_junk_before_sync(self, acceptor):
+        """Test that bytes before SYNC are skipped."""
+        acceptor.reader = FakeReader(b"\xff\x00\x13" + ESCROW)
+
+        assert await acceptor._read_ccnet_message() == ESCROW
+        assert acceptor._rx_buf == b""
+
+    @pytest.mark.asyncio
+    async def test_junk_only_read_is_dropped(self, acceptor):
+        """Test that a read without SYNC is dropped before the next read."""
+        acceptor.reader = FakeReader(b"\xff\xfe", IDLING)
+
+        assert await acceptor._read_ccnet_message() == IDLING
+
+    @pytest.mark.asyncio
+    async def test_frame_split_across_reads(self, acceptor):
+        """Test a frame that arrives in several chunks."""
+        acceptor.reader = FakeReader(ESCROW[:1], ESCROW[1:3], ESCROW[3:5], ESCROW[5:])
+
+        assert await acceptor._read_ccnet_message() == ESCROW
+        assert acceptor.reader.reads == 4
+
+    @pytest.mark.asyncio
+    async def test_two_frames_in_one_read(self, acceptor):
+        """Test that the second frame is served from the buffer."""
+        acceptor.reader = FakeReader(ESCROW + IDLING)
+
+        assert await acceptor._read_ccnet_message() == ESCROW
+        assert await acceptor._read_ccnet_message() == IDLING
+        assert acceptor.reader.reads == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("length", [0, 2, 5, 51, 0xFF])
+    async def test_invalid_length(self, acceptor, length):
+        """Test that an out-of-range LNG byte clears the buffer."""
+        acceptor.reader = FakeReader(bytes([0x02, 0x03, length, 0x14, 0x00, 0x00]))
+
+        assert await acceptor._read_ccnet_message() is None
+        assert acceptor._rx_buf == b""
+
+    @pytest.mark.asyncio
+    async def test_invalid_address(self, acceptor):
+        """Test that a frame for another address is rejected."""
+        frame = bytearray(IDLING)
+        frame[1] = 0x01
+        acceptor.reader = FakeReader(bytes(frame) + IDLING)
+
+        assert await acceptor._read_ccnet_message() is None
+        assert await acceptor._read_ccnet_message() == IDLING
+
+    @pytest.mark.asyncio
+    async def test_crc_mismatch(self, acceptor):
+        """Test that a corrupted frame is dropped and the next one read."""
+        corrupted = bytearray(ESCROW)
+        corrupted[-1] ^= 0xFF
+        acceptor.reader = FakeReader(bytes(corrupted) + IDLING)
+
+        assert await acceptor._read_ccnet_message() is None
+        assert await acceptor._read_ccnet_message() == IDLING
+
+    @pytest.mark.asyncio
+    async def test_timeout_with_partial_frame(self, acceptor, short_timeout):
+        """Test that a partial frame is discarded on timeout."""
+        acceptor.reader = FakeReader(ESCROW[:4])
+
+        assert await acceptor._read_ccnet_message() is None
+        assert acceptor._rx_buf == b""
+
+        # The next message is not glued to the stale bytes
+        acceptor.reader.chunks.append(IDLING)
+        assert await acceptor._read_ccnet_message() == IDLING
+
+    @pytest.mark.asyncio
+    async def test_eof(self, acceptor):
+        """Test that an empty read ends the message."""
+        acceptor.reader = FakeReader(ESCROW[:4], b"")
+
+        assert await acceptor._read_ccnet_message() is None
+        assert acceptor._rx_buf == b""
+
+        # The next message is not glued to the stale bytes
+        acceptor.reader.chunks.append(IDLING)
+        assert await acceptor._read_ccnet_message() == IDLING
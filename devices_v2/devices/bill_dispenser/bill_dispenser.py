@@ -7,7 +7,11 @@ This module provides communication with dual-cassette bill dispensers
 using serial protocol.
 """
 
+import os
 import select
+import time
+from functools import reduce
+from operator import xor
 from typing import Final, Optional
 
 import serial
@@ -40,6 +44,11 @@ EXCEPTION_BAD_STX_CODE: Final[int] = 4
 EXCEPTION_BAD_ACK_RESPONSE_CODE: Final[int] = 5
 EXCEPTION_BAD_COUNT: Final[int] = 6
 
+# Two-digit ASCII encoding of every valid note count (0-60)
+_COUNT_TABLE: Final[tuple[bytes, ...]] = tuple(
+    f"{count:02d}".encode("ascii") for count in range(61)
+)
+
 
 # =============================================================================
 # Exceptions
@@ -74,6 +83,8 @@ class TTY:
     def __init__(self) -> None:
         """Initialize TTY handler."""
         self._serial: Optional[serial.Serial] = None
+        self._fd: int = -1
+        self._poller: Optional[select.poll] = None
 
     def IsOK(self) -> bool:
         """Check if serial port is open and ready."""
@@ -92,6 +103,36 @@ class TTY:
             self._serial = serial.Serial(port=port, baudrate=baudrate, timeout=1)
         except Exception as e:
             raise LcdmException(str(e))
+        self._lower_latency_timer(port)
+        try:
+            # Kernel tty layer hands bytes over without waiting for a timer tick
+            self._serial.set_low_latency_mode(True)
+        except (AttributeError, ValueError):
+            # Not Linux, or the driver has no TIOCSSERIAL support
+            pass
+
+        # pyserial opens the port with O_NONBLOCK, so reads never stall
+        self._fd = self._serial.fileno()
+        self._poller = select.poll()
+        self._poller.register(self._fd, select.POLLIN)
+
+    @staticmethod
+    def _lower_latency_timer(port: str) -> None:
+        """
+        Drop the USB-serial latency timer to 1 ms.
+
+        FTDI adapters hold short replies for up to 16 ms by default.
+        Ports without the sysfs attribute are left as they are.
+
+        Args:
+            port: Serial port path.
+        """
+        name = os.path.basename(os.path.realpath(port))
+        try:
+            with open(f"/sys/bus/usb-serial/devices/{name}/latency_timer", "w") as f:
+                f.write("1")
+        except OSError:
+            pass
 
     def Disconnect(self) -> None:
         """Disconnect from serial port."""
@@ -101,6 +142,8 @@ class TTY:
             except Exception:
                 pass
         self._serial = None
+        self._fd = -1
+        self._poller = None
 
     def Write(self, data: bytes) -> int:
         """
@@ -130,28 +173,32 @@ class TTY:
             Bytes read from port.
 
         Note:
-            Uses select.select() for polling which is Unix-compatible.
-            On Windows, pyserial's timeout-based reading is used as fallback.
+            Waits with poll() and reads the non-blocking descriptor
+            directly, bypassing pyserial's read loop. The deadline keeps
+            the old worst case of ``size * 2`` waits of 2 seconds, so slow
+            dispense responses still fit. Unix only, like pyserial's
+            own POSIX backend.
         """
         if not self.IsOK():
             raise LcdmException("Error. Port not open")
 
         data = bytearray()
-        attempt = size * 2
-        timeout_sec = 2
-
-        while attempt:
-            # Note: select.select() works on Unix; Windows uses pyserial timeout
-            r, _, _ = select.select([self._serial], [], [], timeout_sec)
-            if r:
-                try:
-                    chunk = self._serial.read(size - len(data))
-                    data.extend(chunk)
-                    if len(data) >= size:
-                        break
-                except Exception as e:
-                    raise LcdmException(str(e))
-            attempt -= 1
+        deadline = time.monotonic() + size * 2 * 2
+
+        while len(data) < size:
+            timeout_ms = (deadline - time.monotonic()) * 1000
+            if timeout_ms <= 0 or not self._poller.poll(timeout_ms):
+                break
+            try:
+                chunk = os.read(self._fd, size - len(data))
+            except BlockingIOError:
+                continue
+            except OSError as e:
+                raise LcdmException(str(e))
+            if not chunk:
+                # Readable but empty: the adapter has been unplugged
+                raise LcdmException("Error. Device disconnected")
+            data += chunk
 
         return bytes(data)
 
@@ -189,6 +236,15 @@ class Clcdm2000:
     ACK: Final[int] = 0x06
     NCK: Final[int] = 0x15
 
+    # Constant packet framing: EOT, ID, STX ... ETX
+    _PREFIX: Final[bytes] = bytes((EOT, ID, STX))
+    _SUFFIX: Final[bytes] = bytes((ETX,))
+    # Responses start with SOH, ID, STX
+    _RESPONSE_PREFIX: Final[bytes] = bytes((SOH, ID, STX))
+    # Single-byte replies to device responses
+    _ACK_BYTES: Final[bytes] = bytes((LcdmCommands.ACK,))
+    _NAK_BYTES: Final[bytes] = bytes((LcdmCommands.NAK,))
+
     # Error code mapping
     ERROR_CODES: Final[dict[int, tuple[str, bool]]] = {
         0x30: ("Good", False),
@@ -243,6 +299,12 @@ class Clcdm2000:
 
         self._tty = TTY()
 
+        # Data-less commands always compile to the same bytes
+        self._fixed_packets: dict[int, bytes] = {
+            cmd: self.compileCommand(cmd)
+            for cmd in (LcdmCommands.STATUS, LcdmCommands.PURGE)
+        }
+
     def GetCRC(self, bufData: bytes) -> int:
         """
         Calculate CRC for packet.
@@ -253,10 +315,7 @@ class Clcdm2000:
         Returns:
             CRC byte.
         """
-        crc = bufData[0]
-        for b in bufData[1:]:
-            crc ^= b
-        return crc
+        return reduce(xor, bufData)
 
     def testCRC(self, bufData: bytes) -> bool:
         """
@@ -270,10 +329,7 @@ class Clcdm2000:
         """
         if len(bufData) < 2:
             return False
-        crc = bufData[0]
-        for b in bufData[1:-1]:
-            crc ^= b
-        return crc == bufData[-1]
+        return reduce(xor, memoryview(bufData)[:-1]) == bufData[-1]
 
     def checkErrors(self, test: int) -> bool:
         """
@@ -320,16 +376,8 @@ class Clcdm2000:
         Returns:
             Complete packet bytes with CRC.
         """
-        packet = bytearray()
-        packet.append(self.EOT)
-        packet.append(self.ID)
-        packet.append(self.STX)
-        packet.append(cmd)
-        packet.extend(data)
-        packet.append(self.ETX)
-        crc = self.GetCRC(packet)
-        packet.append(crc)
-        return bytes(packet)
+        body = self._PREFIX + bytes((cmd,)) + data + self._SUFFIX
+        return body + bytes((self.GetCRC(body),))
 
     def sendCommand(self, cmd: int, data: bytes = b"") -> int:
         """
@@ -342,7 +390,9 @@ class Clcdm2000:
         Returns:
             Number of bytes written.
         """
-        packet = self.compileCommand(cmd, data)
+        packet = None if data else self._fixed_packets.get(cmd)
+        if packet is None:
+            packet = self.compileCommand(cmd, data)
         return self._tty.Write(packet)
 
     def getACK(self) -> int:
@@ -359,11 +409,11 @@ class Clcdm2000:
 
     def sendACK(self) -> None:
         """Send ACK to device."""
-        self._tty.Write(bytes([LcdmCommands.ACK]))
+        self._tty.Write(self._ACK_BYTES)
 
     def sendNAK(self) -> None:
         """Send NAK to device."""
-        self._tty.Write(bytes([LcdmCommands.NAK]))
+        self._tty.Write(self._NAK_BYTES)
 
     def getResponse(self, recv_bytes: int, attempts: int = 3) -> bytes:
         """
@@ -376,24 +426,19 @@ class Clcdm2000:
         Returns:
             Response bytes.
         """
-        if attempts <= 0:
-            raise LcdmException("Bad response", EXCEPTION_BAD_RESPONSE_CODE)
+        for _ in range(attempts):
+            raw = self._tty.Read(recv_bytes)
 
-        raw = self._tty.Read(recv_bytes)
-        if len(raw) < 4:
-            self.sendNAK()
-            return self.getResponse(recv_bytes, attempts - 1)
+            # Validate packet structure and CRC
+            if (len(raw) >= 4
+                    and raw[:3] == self._RESPONSE_PREFIX
+                    and self.testCRC(raw)):
+                self.sendACK()
+                return raw
 
-        # Validate packet structure and CRC
-        if (not self.testCRC(raw)
-                or raw[0] != self.SOH
-                or raw[1] != self.ID
-                or raw[2] != self.STX):
             self.sendNAK()
-            return self.getResponse(recv_bytes, attempts - 1)
 
-        self.sendACK()
-        return raw
+        raise LcdmException("Bad response", EXCEPTION_BAD_RESPONSE_CODE)
 
     def go(self, cmd: int, data: bytes = b"", recv_bytes: int = 7) -> bytes:
         """
@@ -463,21 +508,21 @@ class Clcdm2000:
         r6 = response[6]
         r7 = response[7]
 
-        self.CheckSensor1 = bool(r6 & 0b00000001)
-        self.CheckSensor2 = bool(r6 & 0b00000010)
-        self.DivertSensor1 = bool(r6 & 0b00000100)
-        self.DivertSensor2 = bool(r6 & 0b00001000)
-        self.EjectSensor = bool(r6 & 0b00010000)
-        self.ExitSensor = bool(r6 & 0b00100000)
-        self.UpperNearEnd = bool(r6 & 0b01000000)
-
-        self.CheckSensor3 = bool(r7 & 0b00001000)
-        self.CheckSensor4 = bool(r7 & 0b00010000)
-        self.SolenoidSensor = bool(r7 & 0b00000001)
-        self.CashBoxUpper = bool(r7 & 0b00000010)
-        self.CashBoxLower = bool(r7 & 0b00000100)
-        self.LowerNearEnd = bool(r7 & 0b00100000)
-        self.RejectTray = bool(r7 & 0b01000000)
+        self.CheckSensor1 = (r6 & 0b00000001) != 0
+        self.CheckSensor2 = (r6 & 0b00000010) != 0
+        self.DivertSensor1 = (r6 & 0b00000100) != 0
+        self.DivertSensor2 = (r6 & 0b00001000) != 0
+        self.EjectSensor = (r6 & 0b00010000) != 0
+        self.ExitSensor = (r6 & 0b00100000) != 0
+        self.UpperNearEnd = (r6 & 0b01000000) != 0
+
+        self.CheckSensor3 = (r7 & 0b00001000) != 0
+        self.CheckSensor4 = (r7 & 0b00010000) != 0
+        self.SolenoidSensor = (r7 & 0b00000001) != 0
+        self.CashBoxUpper = (r7 & 0b00000010) != 0
+        self.CashBoxLower = (r7 & 0b00000100) != 0
+        self.LowerNearEnd = (r7 & 0b00100000) != 0
+        self.RejectTray = (r7 & 0b01000000) != 0
 
     def testStatus(self) -> None:
         """
@@ -537,7 +582,7 @@ class Clcdm2000:
         if count < 1 or count > 60:
             raise LcdmException("Bad count for upperDispense", EXCEPTION_BAD_COUNT)
 
-        data = f"{count:02d}".encode("ascii")
+        data = _COUNT_TABLE[count]
         len_response = 14
         num_error_byte = 8
 
@@ -560,7 +605,7 @@ class Clcdm2000:
         if count < 1 or count > 60:
             raise LcdmException("Bad count for lowerDispense", EXCEPTION_BAD_COUNT)
 
-        data = f"{count:02d}".encode("ascii")
+        data = _COUNT_TABLE[count]
         len_response = 14
         num_error_byte = 8
 
@@ -601,7 +646,7 @@ class Clcdm2000:
                 EXCEPTION_BAD_COUNT,
             )
 
-        data = f"{count_upper:02d}{count_lower:02d}".encode("ascii")
+        data = _COUNT_TABLE[count_upper] + _COUNT_TABLE[count_lower]
         len_response = 21
         num_error_byte = 12
 
@@ -612,19 +657,17 @@ class Clcdm2000:
         if self.checkErrors(response[num_error_byte]):
             raise LcdmException(self.errorMessage, self.errorCode)
 
-        # Parse response values
-        positions = [
-            (6, 7),    # upper exit
-            (10, 11),  # lower exit
-            (15, 16),  # upper rejected
-            (17, 18),  # lower rejected
-            (4, 5),    # upper check
-            (8, 9),    # lower check
-        ]
-
-        result = []
-        for p1, p2 in positions:
-            val = (response[p1] - 0x30) * 10 + (response[p2] - 0x30)
-            result.append(val)
-
-        return result
\ No newline at end of file
+        # Parse response values (two ASCII digits each)
+        positions = (
+            6,   # upper exit
+            10,  # lower exit
+            15,  # upper rejected
+            17,  # lower rejected
+            4,   # upper check
+            8,   # lower check
+        )
+
+        try:
+            return [int(response[pos:pos + 2]) for pos in positions]
+        except ValueError:
+            raise LcdmException("Bad response", EXCEPTION_BAD_RESPONSE_CODE)
\ No newline at end of file
@@ -7,7 +7,13 @@ device events like bill acceptance, coin credit, and state changes.
 
 import asyncio
 from enum import Enum
-from typing import Callable, Any, Union
+from typing import Callable, Any, Final, NamedTuple, Union
+
+from loggers import logger
+
+
+# Queue bound: publishers wait for the consumer beyond this many events
+EVENT_QUEUE_MAXSIZE: Final[int] = 1024
 
 
 class EventType(str, Enum):
@@ -23,6 +29,51 @@ class EventType(str, Enum):
     CLOSE = "close"
 
 
+class Event(NamedTuple):
+    """
+    An event travelling through the event queue.
+
+    Attributes:
+        type: The event type.
+        data: Event data passed to publish() as keyword arguments.
+    """
+
+    type: Union[EventType, str]
+    data: dict[str, Any]
+
+
+class EventQueue(asyncio.Queue):
+    """
+    FIFO event queue that can hand over its whole backlog at once.
+
+    Bounded by default, so a burst of device events applies backpressure
+    to publishers instead of growing without limit.
+    """
+
+    def __init__(self, maxsize: int = EVENT_QUEUE_MAXSIZE) -> None:
+        """
+        Initialize the event queue.
+
+        Args:
+            maxsize: Maximum number of queued events (0 for unbounded).
+        """
+        super().__init__(maxsize)
+
+    def get_all_nowait(self) -> list[Any]:
+        """
+        Remove and return every item currently in the queue.
+
+        Returns:
+            Queued items in FIFO order (empty list if none).
+        """
+        items = list(self._queue)
+        self._queue.clear()
+        # Free slots for producers blocked on a bounded queue
+        for _ in items:
+            self._wakeup_next(self._putters)
+        return items
+
+
 class EventPublisher:
     """
     Publisher for sending events to the event queue.
@@ -50,8 +101,14 @@ class EventPublisher:
             event_type: The type of event to publish.
             **data: Additional event data as keyword arguments.
         """
-        event = {"type": event_type, **data}
-        await self.event_queue.put(event)
+        queue = self.event_queue
+        await queue.put(Event(event_type, data))
+
+        # Warn once each time the backlog climbs to 80% of the bound
+        if queue.maxsize and queue.qsize() == queue.maxsize * 4 // 5:
+            logger.warning(
+                f"Event queue is 80% full ({queue.qsize()}/{queue.maxsize})"
+            )
 
 
 class EventConsumer:
@@ -62,11 +119,10 @@ class EventConsumer:
 
     Attributes:
         event_queue: The asyncio queue to consume events from.
-        handlers: Mapping of event types to their handler functions.
         is_consuming: Flag indicating if the consumer is active.
     """
 
-    def __init__(self, event_queue: asyncio.Queue) -> None:
+    def __init__(self, event_queue: EventQueue) -> None:
         """
         Initialize the event consumer.
 
@@ -74,7 +130,9 @@ class EventConsumer:
             event_queue: The asyncio queue to consume events from.
         """
         self.event_queue = event_queue
-        self.handlers: dict[Union[EventType, str], list[Callable]] = {}
+        # Handlers are split by kind once, at registration
+        self._async_handlers: dict[Union[EventType, str], list[Callable]] = {}
+        self._sync_handlers: dict[Union[EventType, str], list[Callable]] = {}
         self.is_consuming = False
         self._consume_task: asyncio.Task | None = None
 
@@ -90,9 +148,11 @@ class EventConsumer:
             event_type: The event type to handle.
             handler: The handler function (sync or async).
         """
-        if event_type not in self.handlers:
-            self.handlers[event_type] = []
-        self.handlers[event_type].append(handler)
+        if asyncio.iscoroutinefunction(handler):
+            handlers = self._async_handlers
+        else:
+            handlers = self._sync_handlers
+        handlers.setdefault(event_type, []).append(handler)
 
     def unregister_handler(
         self,
@@ -106,28 +166,24 @@ class EventConsumer:
             event_type: The event type.
             handler: The handler function to remove.
         """
-        if event_type in self.handlers:
-            try:
-                self.handlers[event_type].remove(handler)
-            except ValueError:
-                pass
+        for handlers in (self._async_handlers, self._sync_handlers):
+            if event_type in handlers:
+                try:
+                    handlers[event_type].remove(handler)
+                    return
+                except ValueError:
+                    pass
 
-    async def _process_event(self, event: dict[str, Any]) -> None:
+    async def _process_event(self, event: Event) -> None:
         """
         Process a single event by calling all registered handlers.
 
         Args:
-            event: The event dictionary containing type and data.
+            event: The event containing type and data.
         """
-        event_type = event.get("type")
-        if event_type not in self.handlers:
-            return
-
-        handlers = self.handlers[event_type]
-
-        # Separate async and sync handlers
-        async_handlers = [h for h in handlers if asyncio.iscoroutinefunction(h)]
-        sync_handlers = [h for h in handlers if not asyncio.iscoroutinefunction(h)]
+        event_type = event.type
+        async_handlers = self._async_handlers.get(event_type)
+        sync_handlers = self._sync_handlers.get(event_type, ())
 
         # Execute async handlers concurrently
         if async_handlers:
@@ -149,15 +205,19 @@ class EventConsumer:
         """
         while self.is_consuming:
             try:
-                # Use wait_for with timeout to allow checking is_consuming flag
-                event = await asyncio.wait_for(
-                    self.event_queue.get(),
-                    timeout=0.5,
-                )
-                await self._process_event(event)
-                self.event_queue.task_done()
-            except asyncio.TimeoutError:
-                continue
+                # stop_consuming() cancels this task, so no wakeup timeout is needed
+                event = await self.event_queue.get()
+                # Take everything already queued under the same wakeup
+                batch = [event]
+                batch += self.event_queue.get_all_nowait()
+
+                for event in batch:
+                    try:
+                        await self._process_event(event)
+                    except Exception:
+                        # One failed event must not drop the rest of the batch
+                        logger.exception("Event handler failed for %s", event.type)
+                    self.event_queue.task_done()
             except asyncio.CancelledError:
                 break
             except Exception:
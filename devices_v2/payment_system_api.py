@@ -7,7 +7,7 @@ All device state is persisted in Redis for coordination across processes.
 """
 
 import asyncio
-from typing import Any, Optional
+from typing import Any, Awaitable, Optional
 
 from redis.asyncio import Redis
 
@@ -15,7 +15,7 @@ from devices.cctalk_coin_acceptor import CcTalkAcceptor
 from devices.coin_acceptor.index import SSP
 from devices.bill_acceptor import bill_acceptor_v1, bill_acceptor_v3
 from devices.bill_dispenser.bill_dispenser import Clcdm2000, LcdmException
-from event_system import EventPublisher, EventConsumer, EventType
+from event_system import Event, EventPublisher, EventConsumer, EventQueue, EventType
 from configs import (
     PORT_OPTIONS,
     BILL_DISPENSER_PORT,
@@ -25,7 +25,7 @@ from configs import (
 )
 from loggers import logger
 from redis_error_handler import redis_error_handler
-from send_to_ws import send_to_ws
+from send_to_ws import close_connections, send_to_ws
 
 
 class PaymentSystemAPI:
@@ -55,7 +55,7 @@ class PaymentSystemAPI:
             redis: Redis client instance for state management.
         """
         # Event system
-        self.event_queue: asyncio.Queue = asyncio.Queue()
+        self.event_queue: EventQueue = EventQueue()
         self.event_publisher = EventPublisher(self.event_queue)
         self.event_consumer = EventConsumer(self.event_queue)
 
@@ -73,6 +73,8 @@ class PaymentSystemAPI:
         self.collected_amount: int = 0
         self.active_devices: set[str] = set()
         self.is_payment_in_progress: bool = False
+        # Background write that mirrors collected_amount into Redis
+        self._collected_amount_write: Optional[asyncio.Task] = None
 
         # Bill dispenser configurations
         self.upper_box_value: Optional[int] = None
@@ -89,8 +91,9 @@ class PaymentSystemAPI:
             Dictionary containing success status and bill count information.
         """
         try:
-            max_bill_count = await self.redis.get("max_bill_count")
-            bill_count = await self.redis.get("bill_count")
+            max_bill_count, bill_count = await self.redis.mget(
+                "max_bill_count", "bill_count"
+            )
             return {
                 "success": True,
                 "message": "Bill acceptor status retrieved successfully",
@@ -114,10 +117,17 @@ class PaymentSystemAPI:
             Dictionary containing success status and dispenser configuration.
         """
         try:
-            upper_box_value = await self.redis.get("bill_dispenser:upper_lvl")
-            lower_box_value = await self.redis.get("bill_dispenser:lower_lvl")
-            upper_box_count = await self.redis.get("bill_dispenser:upper_count")
-            lower_box_count = await self.redis.get("bill_dispenser:lower_count")
+            (
+                upper_box_value,
+                lower_box_value,
+                upper_box_count,
+                lower_box_count,
+            ) = await self.redis.mget(
+                "bill_dispenser:upper_lvl",
+                "bill_dispenser:lower_lvl",
+                "bill_dispenser:upper_count",
+                "bill_dispenser:lower_count",
+            )
             return {
                 "success": True,
                 "message": "Bill dispenser status retrieved successfully",
@@ -160,8 +170,12 @@ class PaymentSystemAPI:
             upper_lvl: Denomination value for the upper box.
             lower_lvl: Denomination value for the lower box.
         """
-        await self.redis.set("bill_dispenser:upper_lvl", upper_lvl)
-        await self.redis.set("bill_dispenser:lower_lvl", lower_lvl)
+        await self.redis.mset({
+            "bill_dispenser:upper_lvl": upper_lvl,
+            "bill_dispenser:lower_lvl": lower_lvl,
+        })
+        self.upper_box_value = int(upper_lvl)
+        self.lower_box_value = int(lower_lvl)
 
     @redis_error_handler("Bill dispenser count updated successfully")
     async def set_bill_dispenser_count(self, upper_count: int, lower_count: int) -> None:
@@ -172,16 +186,18 @@ class PaymentSystemAPI:
             upper_count: Number of bills to add to the upper box.
             lower_count: Number of bills to add to the lower box.
         """
-        old_upper_count = int(await self.redis.get("bill_dispenser:upper_count") or 0)
-        old_lower_count = int(await self.redis.get("bill_dispenser:lower_count") or 0)
-        await self.redis.set("bill_dispenser:upper_count", upper_count + old_upper_count)
-        await self.redis.set("bill_dispenser:lower_count", lower_count + old_lower_count)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.incrby("bill_dispenser:upper_count", upper_count)
+            pipe.incrby("bill_dispenser:lower_count", lower_count)
+            await pipe.execute()
 
     @redis_error_handler("Bill dispenser count reset successfully")
     async def bill_dispenser_reset_bill_count(self) -> None:
         """Reset the bill dispenser counts to zero."""
-        await self.redis.set("bill_dispenser:upper_count", 0)
-        await self.redis.set("bill_dispenser:lower_count", 0)
+        await self.redis.mset({
+            "bill_dispenser:upper_count": 0,
+            "bill_dispenser:lower_count": 0,
+        })
 
 
     async def stop_accepting_payment(self) -> dict[str, Any]:
@@ -216,6 +232,7 @@ class PaymentSystemAPI:
                 logger.error(f"Error stopping bill acceptor: {e}")
 
         # Store collected amount before reset
+        await self._flush_collected_amount()
         collected = self.collected_amount
 
         # Reset state
@@ -224,8 +241,7 @@ class PaymentSystemAPI:
         self.collected_amount = 0
 
         # Reset Redis
-        await self.redis.set("collected_amount", 0)
-        await self.redis.set("target_amount", 0)
+        await self.redis.mset({"collected_amount": 0, "target_amount": 0})
 
         logger.info(f"Payment stopped. Collected: {collected / 100} RUB")
         return {
@@ -252,8 +268,8 @@ class PaymentSystemAPI:
                     "test": False,
                 })
             if is_bill:
-                self.upper_box_value = int(await self.redis.get("bill_dispenser:upper_lvl"))
-                self.lower_box_value = int(await self.redis.get("bill_dispenser:lower_lvl"))
+                # Maintenance command outside a payment: read the current values
+                await self._load_box_values()
                 await self.dispense_change(self.upper_box_value + self.lower_box_value)
         except Exception as e:
             return {
@@ -367,15 +383,28 @@ class PaymentSystemAPI:
         Returns:
             Dictionary indicating initialization success.
         """
-        is_hopper = await self._init_ssp_hopper()
-        if is_hopper:
-            self.active_devices.add(self.COIN_DISPENSER_NAME)
-
-        is_coin = await self._init_cctalk_coin_acceptor()
-        if is_coin:
-            self.active_devices.add(self.COIN_ACCEPTOR_NAME)
-
-        await self._init_bill_acceptor()
+        # Devices on separate serial ports are brought up concurrently;
+        # one failing device must not abort or orphan the others
+        results = await asyncio.gather(
+            self._init_ssp_hopper(),
+            self._init_cctalk_coin_acceptor(),
+            self._init_bill_acceptor(),
+            return_exceptions=True,
+        )
+        names = (
+            self.COIN_DISPENSER_NAME,
+            self.COIN_ACCEPTOR_NAME,
+            self.BILL_ACCEPTOR_NAME,
+        )
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to initialize {name}: {result}")
+                self.active_devices.discard(name)
+            elif result:
+                # The bill acceptor returns None and registers itself
+                self.active_devices.add(name)
+
+        # The LCDM driver blocks, so it runs on its own
         await self._init_bill_dispenser()
 
         self._register_event_handlers()
@@ -480,6 +509,14 @@ class PaymentSystemAPI:
 
     async def _init_bill_dispenser(self) -> None:
         """Initialize the bill dispenser."""
+        try:
+            await self._load_box_values()
+        except Exception as e:
+            # Change dispensing reloads the denominations when needed
+            logger.error(f"Failed to load bill dispenser denominations: {e}")
+            self.upper_box_value = None
+            self.lower_box_value = None
+
         try:
             self.bill_dispenser.connect(BILL_DISPENSER_PORT, 9600)
             self.bill_dispenser.purge()
@@ -488,6 +525,21 @@ class PaymentSystemAPI:
         except LcdmException as e:
             logger.error(f"Failed to initialize bill dispenser: {e}")
 
+    async def _load_box_values(self) -> None:
+        """
+        Load the dispenser box denominations from Redis.
+
+        The values are cached on the instance so change dispensing does
+        not re-read them. set_bill_dispenser_lvl updates the cache, and
+        start_accepting_payment and test_dispense_change refresh it from
+        Redis, which picks up writes made outside this class.
+        """
+        upper_box_value, lower_box_value = await self.redis.mget(
+            "bill_dispenser:upper_lvl", "bill_dispenser:lower_lvl"
+        )
+        self.upper_box_value = int(upper_box_value or 0)
+        self.lower_box_value = int(lower_box_value or 0)
+
 
     def _register_event_handlers(self) -> None:
         """Register handlers for device events."""
@@ -500,16 +552,16 @@ class PaymentSystemAPI:
             self.on_coin_credit,
         )
 
-    async def handle_bill_accepted(self, event: dict[str, Any]) -> None:
+    async def handle_bill_accepted(self, event: Event) -> None:
         """
         Handle bill acceptance event.
 
         Args:
-            event: Event dictionary with bill value.
+            event: Event with bill value.
         """
-        bill_value = event["value"]
+        bill_value = event.data["value"]
         self.collected_amount += bill_value
-        await self.redis.set("collected_amount", self.collected_amount)
+        self._persist_collected_amount()
 
         logger.info(
             f"Bill accepted: {bill_value / 100} RUB. "
@@ -524,15 +576,15 @@ class PaymentSystemAPI:
         if self.target_amount != 0 and self.collected_amount >= self.target_amount:
             await self.complete_payment()
 
-    async def on_coin_credit(self, event: dict[str, Any]) -> None:
+    async def on_coin_credit(self, event: Event) -> None:
         """
         Handle coin credit event from ccTalk device.
 
         Args:
-            event: Event dictionary with coin value.
+            event: Event with coin value.
         """
         try:
-            amount = event.get("value")
+            amount = event.data.get("value")
             if amount is None:
                 logger.error(f"Coin event missing value: {event}")
                 return
@@ -541,7 +593,7 @@ class PaymentSystemAPI:
             await self.coin_system_add_coin_count(value=1, denomination=amount)
 
             self.collected_amount += amount
-            await self.redis.set("collected_amount", self.collected_amount)
+            self._persist_collected_amount()
 
             logger.info(
                 f"Coin accepted: {amount / 100} RUB. "
@@ -559,6 +611,34 @@ class PaymentSystemAPI:
         except Exception as e:
             logger.error(f"Error handling coin credit: {e}")
 
+    def _persist_collected_amount(self) -> None:
+        """
+        Write collected_amount to Redis without blocking the caller.
+
+        A single background task does the writing. Credits arriving while
+        it runs are picked up by its loop, so writes stay in order and
+        the last one always carries the latest total.
+        """
+        if self._collected_amount_write is None or self._collected_amount_write.done():
+            self._collected_amount_write = asyncio.create_task(
+                self._write_collected_amount()
+            )
+
+    async def _write_collected_amount(self) -> None:
+        """Write collected_amount until Redis holds the current value."""
+        written = None
+        try:
+            while written != self.collected_amount:
+                written = self.collected_amount
+                await self.redis.set("collected_amount", written)
+        except Exception as e:
+            logger.error(f"Failed to save collected amount: {e}")
+
+    async def _flush_collected_amount(self) -> None:
+        """Wait for a pending background collected_amount write to finish."""
+        if self._collected_amount_write is not None:
+            await self._collected_amount_write
+
 
     async def start_accepting_payment(self, amount: int) -> dict[str, Any]:
         """
@@ -577,11 +657,29 @@ class PaymentSystemAPI:
                 "message": "Invalid payment amount",
             }
 
-        upper_box_count = int(await self.redis.get("bill_dispenser:upper_count") or 0)
-        lower_box_count = int(await self.redis.get("bill_dispenser:lower_count") or 0)
-        bill_count = int(await self.redis.get("bill_count") or 0)
-        max_bill_count = int(await self.redis.get("max_bill_count") or 0)
-        is_test_mode = await self.redis.get("cash_system_is_test_mode")
+        (
+            upper_box_count,
+            lower_box_count,
+            bill_count,
+            max_bill_count,
+            is_test_mode,
+            upper_box_value,
+            lower_box_value,
+        ) = await self.redis.mget(
+            "bill_dispenser:upper_count",
+            "bill_dispenser:lower_count",
+            "bill_count",
+            "max_bill_count",
+            "cash_system_is_test_mode",
+            # Denominations ride along to refresh the change cache
+            "bill_dispenser:upper_lvl",
+            "bill_dispenser:lower_lvl",
+        )
+
+        upper_box_count = int(upper_box_count or 0)
+        lower_box_count = int(lower_box_count or 0)
+        bill_count = int(bill_count or 0)
+        max_bill_count = int(max_bill_count or 0)
 
         if self.is_payment_in_progress:
             logger.error("Payment already in progress")
@@ -610,41 +708,44 @@ class PaymentSystemAPI:
 
         logger.info(f"Starting payment acceptance for {amount / 100} RUB")
 
+        # Other writers (repository, pre_start) may have changed the
+        # denominations in Redis; change for this payment uses these
+        self.upper_box_value = int(upper_box_value or 0)
+        self.lower_box_value = int(lower_box_value or 0)
+
         # Set payment state before starting devices
+        await self._flush_collected_amount()
         self.target_amount = amount
         self.collected_amount = 0
         self.is_payment_in_progress = True
 
-        await self.redis.set("target_amount", amount)
-        await self.redis.set("collected_amount", 0)
+        await self.redis.mset({"target_amount": amount, "collected_amount": 0})
 
         devices_started: list[str] = []
         errors: list[str] = []
 
-        # Start devices with error handling
+        # Start devices concurrently with error handling
+        starters: list[tuple[str, str, Awaitable[None]]] = []
         if self.COIN_ACCEPTOR_NAME in self.active_devices:
-            try:
-                await self.cctalk_acceptor.enable()
-                devices_started.append(self.COIN_ACCEPTOR_NAME)
-                logger.info("Coin acceptor enabled")
-            except Exception as e:
-                logger.error(f"Failed to enable coin acceptor: {e}")
-                errors.append(f"{self.COIN_ACCEPTOR_NAME}: {e}")
-
+            starters.append(
+                (self.COIN_ACCEPTOR_NAME, "Coin acceptor", self.cctalk_acceptor.enable())
+            )
         if self.BILL_ACCEPTOR_NAME in self.active_devices and self.bill_acceptor:
-            try:
-                # Ensure device is not active
-                if self.bill_acceptor._active:
-                    logger.warning("Bill acceptor was active, stopping first")
-                    await self.bill_acceptor.stop_accepting()
-                    await asyncio.sleep(0.5)
-
-                await self.bill_acceptor.start_accepting()
-                devices_started.append(self.BILL_ACCEPTOR_NAME)
-                logger.info("Bill acceptor enabled")
-            except Exception as e:
-                logger.error(f"Failed to enable bill acceptor: {e}")
-                errors.append(f"{self.BILL_ACCEPTOR_NAME}: {e}")
+            starters.append(
+                (self.BILL_ACCEPTOR_NAME, "Bill acceptor", self._start_bill_acceptor())
+            )
+
+        results = await asyncio.gather(
+            *(starter for _, _, starter in starters),
+            return_exceptions=True,
+        )
+        for (name, label, _), result in zip(starters, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to enable {label.lower()}: {result}")
+                errors.append(f"{name}: {result}")
+            else:
+                devices_started.append(name)
+                logger.info(f"{label} enabled")
 
         if devices_started:
             message = f"Accepting payment of {amount / 100} RUB. Active: {', '.join(devices_started)}"
@@ -665,6 +766,16 @@ class PaymentSystemAPI:
                 "message": f"Failed to start devices. Errors: {'; '.join(errors)}",
             }
 
+    async def _start_bill_acceptor(self) -> None:
+        """Start bill acceptance, stopping a still-active acceptor first."""
+        # Ensure device is not active
+        if self.bill_acceptor._active:
+            logger.warning("Bill acceptor was active, stopping first")
+            await self.bill_acceptor.stop_accepting()
+            await asyncio.sleep(0.5)
+
+        await self.bill_acceptor.start_accepting()
+
     async def complete_payment(self) -> None:
         """Complete the payment and dispense change if needed."""
         logger.info("=== COMPLETING PAYMENT ===")
@@ -692,11 +803,11 @@ class PaymentSystemAPI:
             except Exception as e:
                 logger.error(f"Error disabling coin acceptor: {e}")
 
-        # Reset counters
+        # Reset counters (after any pending write of the old total)
+        await self._flush_collected_amount()
         self.target_amount = 0
         self.collected_amount = 0
-        await self.redis.set("collected_amount", 0)
-        await self.redis.set("target_amount", 0)
+        await self.redis.mset({"collected_amount": 0, "target_amount": 0})
 
         logger.info(f"Payment completed: {collected / 100} RUB, change: {change / 100} RUB")
 
@@ -724,8 +835,8 @@ class PaymentSystemAPI:
         """
         dispensed_amount = 0
 
-        self.upper_box_value = int(await self.redis.get("bill_dispenser:upper_lvl") or 0)
-        self.lower_box_value = int(await self.redis.get("bill_dispenser:lower_lvl") or 0)
+        if self.upper_box_value is None or self.lower_box_value is None:
+            await self._load_box_values()
 
         # Try dispensing bills first
         if self.BILL_DISPENSER_NAME in self.active_devices and amount >= self.lower_box_value:
@@ -755,10 +866,10 @@ class PaymentSystemAPI:
                     amount -= dispensed_amount
 
                     # Update Redis counts
-                    upper_count = int(await self.redis.get("bill_dispenser:upper_count") or 0)
-                    lower_count = int(await self.redis.get("bill_dispenser:lower_count") or 0)
-                    await self.redis.set("bill_dispenser:upper_count", upper_count - upper_exit)
-                    await self.redis.set("bill_dispenser:lower_count", lower_count - lower_exit)
+                    async with self.redis.pipeline(transaction=False) as pipe:
+                        pipe.decrby("bill_dispenser:upper_count", upper_exit)
+                        pipe.decrby("bill_dispenser:lower_count", lower_exit)
+                        await pipe.execute()
 
             except Exception as e:
                 logger.error(f"Error dispensing bills: {e}")
@@ -878,6 +989,12 @@ class PaymentSystemAPI:
             # Stop event consumer
             await self.event_consumer.stop_consuming()
 
+            # Let the last collected_amount reach Redis
+            await self._flush_collected_amount()
+
+            # Close the frontend connection once no more events can be sent
+            await close_connections()
+
             logger.info("Payment system shut down successfully")
         except Exception as e:
             logger.error(f"Error during shutdown: {e}")
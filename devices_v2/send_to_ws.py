@@ -5,16 +5,91 @@ This module provides utilities for sending real-time events
 to connected WebSocket clients.
 """
 
+import asyncio
 import json
-from typing import Any, Optional
+from typing import Any, Final, Optional
 
 import websockets
-from websockets.exceptions import WebSocketException
+from websockets.asyncio.client import ClientConnection
+from websockets.exceptions import ConnectionClosed, WebSocketException
+from websockets.protocol import State
 
 from configs import WS_URL
 from loggers import logger
 
 
+# Keepalive ping interval for the cached connections, seconds
+WS_PING_INTERVAL: Final[float] = 20
+
+# Open connections are reused between events, one per URL
+_connections: dict[str, ClientConnection] = {}
+_connect_lock = asyncio.Lock()
+_reader_tasks: set[asyncio.Task] = set()
+
+
+async def _discard_incoming(ws: ClientConnection) -> None:
+    """
+    Read and drop messages from the server.
+
+    Keeps the receive buffer from filling up, which would stall the
+    connection, including its keepalive pings.
+
+    Args:
+        ws: Connection to drain.
+    """
+    try:
+        async for _ in ws:
+            pass
+    except ConnectionClosed:
+        pass
+
+
+async def _get_connection(ws_url: str) -> ClientConnection:
+    """
+    Return an open connection to the URL, connecting if needed.
+
+    Args:
+        ws_url: WebSocket URL to connect to.
+
+    Returns:
+        Open WebSocket connection.
+    """
+    ws = _connections.get(ws_url)
+    if ws is not None and ws.state is State.OPEN:
+        return ws
+
+    async with _connect_lock:
+        # Another sender may have reconnected while we waited
+        ws = _connections.get(ws_url)
+        if ws is None or ws.state is not State.OPEN:
+            ws = await websockets.connect(ws_url, ping_interval=WS_PING_INTERVAL)
+            _connections[ws_url] = ws
+            task = asyncio.create_task(_discard_incoming(ws))
+            _reader_tasks.add(task)
+            task.add_done_callback(_reader_tasks.discard)
+        return ws
+
+
+async def close_connections() -> None:
+    """
+    Close every cached connection and stop its reader task.
+
+    Called on shutdown. A later send_to_ws() opens a new connection.
+    """
+    connections = list(_connections.values())
+    _connections.clear()
+    for ws in connections:
+        try:
+            await ws.close()
+        except Exception as e:
+            logger.warning(f"Failed to close WebSocket connection: {e}")
+
+    tasks = list(_reader_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
 async def send_to_ws(
     event: str,
     data: Optional[dict[str, Any]] = None,
@@ -23,6 +98,9 @@ async def send_to_ws(
     """
     Send an event to the WebSocket server.
 
+    The connection stays open for later events and is re-established
+    when the server has dropped it.
+
     Args:
         event: The event name/type to send.
         data: Optional dictionary of event data.
@@ -37,16 +115,26 @@ async def send_to_ws(
             data={'bill_value': 10000, 'collected_amount': 10000},
         )
     """
-    message = {"event": event, "data": data}
+    message = json.dumps({"event": event, "data": data})
 
-    try:
-        async with websockets.connect(ws_url) as ws:
-            await ws.send(json.dumps(message))
+    for attempt in range(2):
+        ws = None
+        try:
+            ws = await _get_connection(ws_url)
+            await ws.send(message)
             logger.debug(f"WebSocket message sent: {event}")
             return True
-    except WebSocketException as e:
-        logger.warning(f"WebSocket connection error: {e}")
-        return False
-    except Exception as e:
-        logger.error(f"Failed to send WebSocket message: {e}")
-        return False
+        except ConnectionClosed as e:
+            # Stale connection: forget it and retry once on a fresh one
+            if ws is not None and _connections.get(ws_url) is ws:
+                del _connections[ws_url]
+            if attempt:
+                logger.warning(f"WebSocket connection error: {e}")
+                return False
+        except WebSocketException as e:
+            logger.warning(f"WebSocket connection error: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Failed to send WebSocket message: {e}")
+            return False
+    return False
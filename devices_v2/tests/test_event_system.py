@@ -0,0 +1,65 @@
+"""
+Unit tests for the event queue.
+
+get_all_nowait() relies on asyncio.Queue internals, so these tests
+check it against the public Queue behaviour it must preserve.
+"""
+
+import asyncio
+import pytest
+
+from event_system import EventQueue
+
+
+class TestEventQueue:
+    """Tests for EventQueue.get_all_nowait."""
+
+    def test_get_all_nowait_empty(self):
+        """Test draining an empty queue."""
+        queue = EventQueue()
+        assert queue.get_all_nowait() == []
+
+    @pytest.mark.asyncio
+    async def test_get_all_nowait_wakes_blocked_putters(self):
+        """Test FIFO order, putter wakeup and task_done/join balance."""
+        queue = EventQueue(maxsize=3)
+        for item in range(3):
+            queue.put_nowait(item)
+
+        # Two publishers block on the full queue
+        putters = [asyncio.create_task(queue.put(item)) for item in (3, 4)]
+        await asyncio.sleep(0)
+        assert not any(putter.done() for putter in putters)
+
+        assert queue.get_all_nowait() == [0, 1, 2]
+        assert queue.empty()
+
+        # The freed slots let both blocked putters finish
+        await asyncio.wait_for(asyncio.gather(*putters), timeout=1.0)
+        assert queue.qsize() == 2
+        assert queue.get_all_nowait() == [3, 4]
+
+        # Every item taken still needs a task_done before join returns
+        join = asyncio.create_task(queue.join())
+        for _ in range(4):
+            queue.task_done()
+        await asyncio.sleep(0)
+        assert not join.done()
+
+        queue.task_done()
+        await asyncio.wait_for(join, timeout=1.0)
+
+        with pytest.raises(ValueError):
+            queue.task_done()
+
+    @pytest.mark.asyncio
+    async def test_get_all_nowait_after_get(self):
+        """Test mixing get() and get_all_nowait() keeps FIFO order."""
+        queue = EventQueue(maxsize=4)
+        for item in range(4):
+            await queue.put(item)
+
+        assert await queue.get() == 0
+        assert queue.get_all_nowait() == [1, 2, 3]
+        await queue.put(4)
+        assert queue.get_nowait() == 4
@@ -0,0 +1,227 @@
+"""
+Unit tests for PaymentSystemAPI.
+
+Covers the background collected_amount writer, which mirrors the total
+into Redis from a task, and concurrent device initialization.
+"""
+
+import asyncio
+import pytest
+
+from payment_system_api import PaymentSystemAPI
+
+
+class FakeRedis:
+    """In-memory Redis stand-in that yields to the loop on every call."""
+
+    def __init__(self, **values):
+        self.data = {key: str(value) for key, value in values.items()}
+        # (key, value) of every write, in order
+        self.writes: list[tuple[str, str]] = []
+
+    async def set(self, key, value):
+        await asyncio.sleep(0)
+        self.data[key] = str(value)
+        self.writes.append((key, str(value)))
+        return True
+
+    async def mset(self, mapping):
+        await asyncio.sleep(0)
+        for key, value in mapping.items():
+            self.data[key] = str(value)
+            self.writes.append((key, str(value)))
+        return True
+
+    async def mget(self, *keys):
+        await asyncio.sleep(0)
+        return [self.data.get(key) for key in keys]
+
+
+@pytest.fixture
+def redis():
+    """Redis with a stocked dispenser and room in the bill acceptor."""
+    return FakeRedis(
+        **{
+            "bill_dispenser:upper_count": 100,
+            "bill_dispenser:lower_count": 100,
+            "bill_count": 0,
+            "max_bill_count": 500,
+        }
+    )
+
+
+@pytest.fixture
+def api(redis):
+    """Payment API with no active devices."""
+    return PaymentSystemAPI(redis)
+
+
+def collected_writes(redis: FakeRedis) -> list[int]:
+    """Values written to collected_amount, in order."""
+    return [int(value) for key, value in redis.writes if key == "collected_amount"]
+
+
+class TestCollectedAmountWriter:
+    """Tests for _persist_collected_amount and _flush_collected_amount."""
+
+    @pytest.mark.asyncio
+    async def test_last_value_wins(self, api, redis):
+        """Test that credits during a write end with the latest total."""
+        for amount in (1000, 1500, 6500, 16500):
+            api.collected_amount = amount
+            api._persist_collected_amount()
+            await asyncio.sleep(0)
+
+        await api._flush_collected_amount()
+
+        writes = collected_writes(redis)
+        assert writes == sorted(writes)
+        assert writes[-1] == 16500
+        assert redis.data["collected_amount"] == "16500"
+
+    @pytest.mark.asyncio
+    async def test_single_writer_task(self, api):
+        """Test that a burst of credits shares one background task."""
+        api.collected_amount = 1000
+        api._persist_collected_amount()
+        task = api._collected_amount_write
+
+        api.collected_amount = 2000
+        api._persist_collected_amount()
+
+        assert api._collected_amount_write is task
+        await api._flush_collected_amount()
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_before_reset(self, api, redis):
+        """Test that stop waits for the write and the reset comes last."""
+        api.is_payment_in_progress = True
+        api.collected_amount = 5000
+        api._persist_collected_amount()
+
+        result = await api.stop_accepting_payment()
+
+        assert result["collected_amount"] == 5000
+        assert api._collected_amount_write.done()
+        assert collected_writes(redis)[-1] == 0
+        assert redis.data["collected_amount"] == "0"
+
+    @pytest.mark.asyncio
+    async def test_shutdown_flushes(self, api, redis):
+        """Test that shutdown waits for a pending write."""
+        api.collected_amount = 7000
+        api._persist_collected_amount()
+
+        await api.shutdown()
+
+        assert api._collected_amount_write.done()
+        assert redis.data["collected_amount"] == "7000"
+
+    @pytest.mark.asyncio
+    async def test_start_not_overwritten_by_stale_total(self, api, redis):
+        """Test that an old total cannot land after the start reset."""
+        api.collected_amount = 9000
+        api._persist_collected_amount()
+
+        await api.start_accepting_payment(10000)
+        # Give any leftover write a chance to run
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert api._collected_amount_write.done()
+        assert redis.data["collected_amount"] == "0"
+        assert redis.data["target_amount"] == "10000"
+        assert collected_writes(redis)[-1] == 0
+
+
+class TestInitDevices:
+    """Tests for concurrent device initialization."""
+
+    @pytest.mark.asyncio
+    async def test_failing_device_does_not_abort_others(self, api, redis):
+        """Test that an init exception only drops that one device."""
+        hopper_done = asyncio.Event()
+
+        async def init_hopper():
+            await asyncio.sleep(0.01)
+            hopper_done.set()
+            return True
+
+        async def init_coin_acceptor():
+            raise RuntimeError("port busy")
+
+        async def init_bill_acceptor():
+            raise AttributeError("no firmware")
+
+        async def init_bill_dispenser():
+            pass
+
+        async def smembers(key):
+            return {api.COIN_DISPENSER_NAME, api.COIN_ACCEPTOR_NAME}
+
+        api._init_ssp_hopper = init_hopper
+        api._init_cctalk_coin_acceptor = init_coin_acceptor
+        api._init_bill_acceptor = init_bill_acceptor
+        api._init_bill_dispenser = init_bill_dispenser
+        redis.smembers = smembers
+
+        result = await api.init_devices()
+
+        # The slow hopper finished inside init_devices, not after it
+        assert hopper_done.is_set()
+        assert api.active_devices == {api.COIN_DISPENSER_NAME}
+        assert result["success"] is False
+
+        # init_devices starts the consumer in a task of its own
+        await asyncio.sleep(0)
+        await api.event_consumer.stop_consuming()
+
+    @pytest.mark.asyncio
+    async def test_denomination_load_failure_does_not_abort(self, api, redis):
+        """Test that a Redis failure in the dispenser init is contained."""
+
+        async def init_device():
+            return True
+
+        async def init_bill_acceptor():
+            pass
+
+        async def mget(*keys):
+            raise ConnectionError("Redis is down")
+
+        async def smembers(key):
+            return set()
+
+        api._init_ssp_hopper = init_device
+        api._init_cctalk_coin_acceptor = init_device
+        api._init_bill_acceptor = init_bill_acceptor
+        api.bill_dispenser.connect = lambda port, baudrate: None
+        api.bill_dispenser.purge = lambda: None
+        redis.mget = mget
+        redis.smembers = smembers
+
+        result = await api.init_devices()
+        await asyncio.sleep(0)
+
+        assert result["success"] is True
+        assert api.BILL_DISPENSER_NAME in api.active_devices
+        assert api.upper_box_value is None and api.lower_box_value is None
+        assert api.event_consumer.is_consuming
+        await api.event_consumer.stop_consuming()
+
+
+class TestBoxValueCache:
+    """Tests for the cached dispenser box denominations."""
+
+    @pytest.mark.asyncio
+    async def test_start_refreshes_denominations(self, api, redis):
+        """Test that a payment picks up denominations written elsewhere."""
+        api.upper_box_value = 1000
+        api.lower_box_value = 500
+        redis.data["bill_dispenser:upper_lvl"] = "5000"
+        redis.data["bill_dispenser:lower_lvl"] = "100"
+
+        await api.start_accepting_payment(10000)
+
+        assert api.upper_box_value == 5000
+        assert api.lower_box_value == 100